@@ -2,11 +2,32 @@
 Coder Agent - Generates code files
 """
 import os
-import json
-from core.llm import call_llm
-from core.project_state import PROJECT_STATE
+from concurrent.futures import as_completed
+from core import fast_json
+from core.llm import call_llm_stream, is_error_response, MAX_CONCURRENT_CALLS
+from core.bulk_io import project_file_path
+from core.gen_cache import content_hash, load_gen_cache, save_gen_cache
+from core.project_state import get_plan, get_plan_json
+from core.thread_pool import DaemonThreadPoolExecutor
 
-def coder_agent(project_path, api_url, model):
+# Name of the per-project cache of (file, plan) hashes -> generated files
+CODE_CACHE = "code-cache"
+
+# Static part of the prompt, kept byte-identical across calls
+CODER_INSTRUCTIONS = """Generate code for one file of the project described below.
+
+Requirements:
+1. Write complete, working code
+2. Include proper imports
+3. Add comments for complex logic
+4. Follow PEP 8 style guide
+5. Handle edge cases
+
+Only return the code, no explanations.
+
+"""
+
+def coder_agent(project_path, api_url, model, progress_callback=None):
     """
     Generate code for planned project files
     
@@ -14,44 +35,92 @@ def coder_agent(project_path, api_url, model):
         project_path: Path to project
         api_url: LLM API URL
         model: LLM model name
+        progress_callback: Optional callable(done, total, file_name)
     """
-    plan = PROJECT_STATE.get('plan', {})
+    plan = get_plan()
     files_to_create = plan.get('files', ['main.py'])
     
+    # Serialized once per plan and shared by every file
+    plan_json = get_plan_json()
+    cache = load_gen_cache(project_path, CODE_CACHE)
+    
+    base = os.path.join(project_path, "")
+    pending = {}
+    full_paths = {}
     for file_name in files_to_create:
+        try:
+            full_path = project_file_path(base, file_name)
+        except ValueError:
+            continue
+        
+        # One stat answers both "exists?" and "has content?"
+        try:
+            size = os.stat(full_path).st_size
+        except OSError:
+            size = None
+        
         # Skip if file already exists with content
-        full_path = os.path.join(project_path, file_name)
-        if os.path.exists(full_path) and os.path.getsize(full_path) > 100:
+        if size is not None and size > 100:
+            continue
+        # Skip if it was already generated from this exact plan
+        signature = content_hash("\0".join([file_name, plan_json]))
+        if size is not None and cache.get(file_name) == signature:
             continue
-            
-        # Generate code for this file
-        code = generate_file_code(file_name, plan, api_url, model)
+        pending[file_name] = signature
+        full_paths[file_name] = full_path
+    
+    if not pending:
+        return
+    
+    def generate_and_save(file_name):
+        failed = []
         
-        # Save file
-        save_code_file(project_path, file_name, code)
-
-def generate_file_code(file_name, plan, api_url, model):
-    """Generate code for a specific file"""
-    prompt = f"""Generate code for file: {file_name}
+        def track(chunks):
+            for chunk in chunks:
+                if is_error_response(chunk):
+                    failed.append(chunk)
+                yield chunk
+        
+        # Chunks go to disk as the model produces them
+        code = generate_file_code(file_name, plan, api_url, model, plan_json=plan_json)
+        save_code_file(project_path, file_name, track(code), full_path=full_paths[file_name])
+        return file_name, not failed
     
-Project Plan:
-{json.dumps(plan, indent=2)}
-
-Requirements:
-1. Write complete, working code
-2. Include proper imports
-3. Add comments for complex logic
-4. Follow PEP 8 style guide
-5. Handle edge cases
+    # LLM calls are independent, so issue them concurrently
+    with DaemonThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS) as executor:
+        futures = [executor.submit(generate_and_save, name) for name in pending]
+        for i, future in enumerate(as_completed(futures)):
+            file_name, ok = future.result()
+            if ok:
+                cache[file_name] = pending[file_name]
+            if progress_callback:
+                progress_callback(i + 1, len(pending), file_name)
+    
+    save_gen_cache(project_path, CODE_CACHE, cache)
 
-Only return the code, no explanations."""
+def generate_file_code(file_name, plan, api_url, model, plan_json=None):
+    """Generate code for a specific file, yielding it in chunks"""
+    if plan_json is None:
+        plan_json = fast_json.dumps(plan, indent=True)
     
-    return call_llm(prompt, api_url, model)
+    # Static requirements first, per-file details last
+    prompt = "".join([CODER_INSTRUCTIONS, "File: ", file_name, "\n\nProject Plan:\n", plan_json])
+    
+    # Source is written to disk, so only an identical prompt may be reused
+    return call_llm_stream(prompt, api_url, model)
 
-def save_code_file(project_path, file_name, code):
-    """Save generated code to file"""
-    full_path = os.path.join(project_path, file_name)
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+def save_code_file(project_path, file_name, code, full_path=None):
+    """Save generated code to file; code may be a string or an iterable of chunks"""
+    if full_path is None:
+        full_path = os.path.join(project_path, file_name)
+    # A bare file name with an empty project path has no directory to create
+    directory = os.path.dirname(full_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
     
     with open(full_path, 'w', encoding='utf-8') as f:
-        f.write(code)
\ No newline at end of file
+        if isinstance(code, str):
+            f.write(code)
+        else:
+            for chunk in code:
+                f.write(chunk)
\ No newline at end of file
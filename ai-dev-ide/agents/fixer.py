@@ -2,10 +2,57 @@
 Fixer Agent - Analyzes errors and suggests fixes
 """
 import os
-import json
-from core.llm import call_llm
+import re
+from collections import Counter
+from core import fast_json
+from core.llm import call_llm_stream
+from core.bulk_io import read_files_bulk
 
-def fixer_agent(project_path, file_paths, error_log, api_url, model):
+# ijson parses the fixes object incrementally instead of all at once
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Lines shorter than this aren't worth replacing with a placeholder
+MIN_SHARED_LINE_LENGTH = 16
+
+# Files longer than this are cut down to the lines around their errors
+MAX_EXCERPT_CHARS = 2000
+
+# Lines of context kept on each side of an error line
+ERROR_WINDOW_LINES = 30
+
+_TRACEBACK_RE = re.compile(r'File "([^"]+)", line (\d+)')
+
+# Placeholder the prompt uses for the Nth shared line
+_PLACEHOLDER_RE = re.compile(r'<<S(\d+)>>')
+
+# Static part of the prompt, kept byte-identical across calls
+FIX_INSTRUCTIONS = """Analyze the errors below and suggest fixes.
+
+INSTRUCTIONS:
+1. Analyze each error and identify the root cause
+2. For each file that needs changes, provide the corrected version
+3. Return your response as JSON in this format:
+{
+  "analysis": "Brief explanation of the errors",
+  "fixes": {
+    "filename1.py": "full corrected content here",
+    "filename2.py": "full corrected content here"
+  }
+}
+
+IMPORTANT: Only return the JSON, no additional text.
+
+Lines written as <<S1>>, <<S2>>, ... stand for the matching entry under
+COMMON LINES. Always write them out in full in corrected files.
+Numbered lines ("  42| code") are excerpts around an error; the number
+is not part of the code.
+"""
+
+def fixer_agent(project_path, file_paths, error_log, api_url, model, on_fix=None):
     """
     Analyze errors and suggest fixes
     
@@ -15,67 +62,230 @@ def fixer_agent(project_path, file_paths, error_log, api_url, model):
         error_log: Error output from running the script
         api_url: LLM API URL
         model: LLM model name
+        on_fix: Optional callback given each (filename, content) as soon
+            as it has been parsed from the response
     """
-    # Read the files
-    files_content = {}
-    for file_path in file_paths:
-        full_path = os.path.join(project_path, file_path)
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                files_content[file_path] = f.read()
-        except:
-            files_content[file_path] = ""
+    # Read the files in one batch
+    full_paths = {file_path: os.path.join(project_path, file_path) for file_path in file_paths}
+    contents = read_files_bulk(full_paths.values())
+    files_content = {file_path: contents[full_path] for file_path, full_path in full_paths.items()}
     
     # Create the prompt for fixing
-    prompt = create_fix_prompt(files_content, error_log)
-    
-    # Get AI response
-    response = call_llm(prompt, api_url, model)
+    prompt, shared = create_fix_prompt(files_content, error_log)
     
-    # Parse the response
-    fixes = parse_fix_response(response)
+    # Stream the AI response and hand each fix on as soon as it is parsed
+    chunks = call_llm_stream(prompt, api_url, model)
+    fixes = {}
+    for filename, content in iter_fixes(chunks, shared):
+        fixes[filename] = content
+        if on_fix:
+            on_fix(filename, content)
     
     return fixes
 
 def create_fix_prompt(files_content, error_log):
-    """Create a prompt for fixing errors"""
-    prompt = """Analyze these errors and suggest fixes:
-    ERROR LOG:{error_log}
-FILES TO FIX:
-"""
+    """
+    Create a prompt for fixing errors
     
-    for file_path, content in files_content.items():
-        prompt += f"\n--- {file_path} ---\n{content[:2000]}\n"
+    Returns:
+        Tuple of (prompt, shared lines behind its <<SN>> placeholders)
+    """
+    error_lines = find_error_lines(error_log, files_content)
+    excerpts = {
+        file_path: excerpt_content(content, error_lines.get(file_path))
+        for file_path, content in files_content.items()
+    }
+    excerpts, shared = deduplicate_lines(excerpts)
     
-    prompt += """
-INSTRUCTIONS:
-1. Analyze each error and identify the root cause
-2. For each file that needs changes, provide the corrected version
-3. Return your response as JSON in this format:
-{
-  "analysis": "Brief explanation of the errors",
-  "fixes": {
-    "filename1.py": "full corrected content here",
-    "filename2.py": "full corrected content here"
-  }
-}
+    # Static instructions first so providers can reuse the cached prefix
+    parts = [FIX_INSTRUCTIONS]
+    if shared:
+        parts.append("\nCOMMON LINES:\n")
+        parts.extend(f"<<S{i}>> {line}\n" for i, line in enumerate(shared, 1))
+    
+    parts.append(f"\nERROR LOG:\n{error_log}\n\nFILES TO FIX:\n")
+    for file_path, content in excerpts.items():
+        parts.append(f"\n--- {file_path} ---\n{content}\n")
+    
+    return "".join(parts), shared
 
-IMPORTANT: Only return the JSON, no additional text."""
+def find_error_lines(error_log, file_paths):
+    """Map each of file_paths to the traceback line numbers that point into it"""
+    error_lines = {}
+    for path, line in _TRACEBACK_RE.findall(error_log):
+        path = os.path.normpath(path)
+        for file_path in file_paths:
+            rel_path = os.path.normpath(file_path)
+            if path == rel_path or path.endswith(os.sep + rel_path):
+                error_lines.setdefault(file_path, set()).add(int(line))
+    return error_lines
+
+def excerpt_content(content, line_numbers=None):
+    """
+    Cut a long file down to numbered windows around its error lines
     
-    return prompt.format(error_log=error_log)
+    Short files are returned whole; long files without known error
+    lines keep their first MAX_EXCERPT_CHARS characters.
+    """
+    if len(content) <= MAX_EXCERPT_CHARS:
+        return content
+    if not line_numbers:
+        return content[:MAX_EXCERPT_CHARS]
+    
+    lines = content.splitlines()
+    
+    # Merge overlapping windows so no line is sent twice
+    windows = []
+    for line in sorted(line_numbers):
+        start = max(line - 1 - ERROR_WINDOW_LINES, 0)
+        end = min(line + ERROR_WINDOW_LINES, len(lines))
+        if start >= end:
+            continue
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], end)
+        else:
+            windows.append([start, end])
+    if not windows:
+        return content[:MAX_EXCERPT_CHARS]
+    
+    parts = []
+    for start, end in windows:
+        if start > 0:
+            parts.append("...")
+        parts.extend(f"{i + 1:4d}| {lines[i]}" for i in range(start, end))
+    if windows[-1][1] < len(lines):
+        parts.append("...")
+    return "\n".join(parts)
 
-def parse_fix_response(response):
+def deduplicate_lines(files_content):
+    """
+    Replace lines that appear in more than one file with placeholders
+    
+    Returns:
+        Tuple of (rewritten files_content, list of shared lines) where the
+        Nth shared line is referenced as <<SN>>
+    """
+    if len(files_content) < 2:
+        return files_content, []
+    
+    # Count each line once per file, keeping first-seen order so the
+    # prompt is identical across runs
+    line_counts = Counter(
+        line
+        for content in files_content.values()
+        for line in dict.fromkeys(content.splitlines())
+        if len(line.strip()) >= MIN_SHARED_LINE_LENGTH
+    )
+    shared = [line for line, count in line_counts.items() if count >= 2]
+    if not shared:
+        return files_content, []
+    
+    placeholders = {line: f"<<S{i}>>" for i, line in enumerate(shared, 1)}
+    rewritten = {
+        file_path: "\n".join(placeholders.get(line, line) for line in content.splitlines())
+        for file_path, content in files_content.items()
+    }
+    return rewritten, shared
+
+def expand_placeholders(content, shared):
+    """
+    Write out <<SN>> placeholders the model copied into a fixed file
+    
+    Returns:
+        The expanded content, or None if it names a shared line that
+        doesn't exist and so can't be written safely
+    """
+    if "<<S" not in content:
+        return content
+    
+    unknown = []
+    
+    def replace(match):
+        index = int(match.group(1)) - 1
+        if 0 <= index < len(shared):
+            return shared[index]
+        unknown.append(match.group(0))
+        return match.group(0)
+    
+    expanded = _PLACEHOLDER_RE.sub(replace, content)
+    return None if unknown else expanded
+
+def parse_fix_response(response, shared=()):
     """Parse the AI response to extract fixes"""
+    return dict(iter_fixes(response, shared))
+
+def iter_fixes(response, shared=()):
+    """
+    Yield writable (filename, content) pairs from the "fixes" object of a
+    response, with shared-line placeholders expanded
+    
+    Args:
+        response: The response text, or an iterable of its chunks
+        shared: Shared lines behind the prompt's <<SN>> placeholders
+    
+    Malformed JSON ends the iteration rather than raising, so fixes that
+    were already complete are kept.
+    """
+    seen = set()
+    for filename, content in _iter_raw_fixes(response):
+        # Only file contents can be written back
+        if filename in seen or not isinstance(content, str):
+            continue
+        content = expand_placeholders(content, shared)
+        if content is not None:
+            seen.add(filename)
+            yield filename, content
+
+def _iter_raw_fixes(response):
+    """Yield every entry of the "fixes" object, however malformed the rest"""
+    is_text = isinstance(response, str)
+    
+    if IJSON_AVAILABLE:
+        try:
+            yield from ijson.kvitems(_ChunkReader((response,) if is_text else response), 'fixes')
+            return
+        except (ijson.JSONError, ValueError):
+            # Backends differ in what they raise. A stream can't be read
+            # twice, so it keeps only the fixes that were complete
+            if not is_text:
+                return
+    
+    if not is_text:
+        response = "".join(response)
+    
+    # Try to find JSON in the response
+    start = response.find('{')
+    end = response.rfind('}') + 1
+    if start < 0 or end <= start:
+        return
+    
     try:
-        # Try to find JSON in the response
-        start = response.find('{')
-        end = response.rfind('}') + 1
-        
-        if start >= 0 and end > start:
-            json_str = response[start:end]
-            result = json.loads(json_str)
-            return result.get("fixes", {})
-    except:
-        pass
-    
-    return {}
\ No newline at end of file
+        result = fast_json.loads(response[start:end])
+    except ValueError:
+        return
+    fixes = result.get("fixes") if isinstance(result, dict) else None
+    if isinstance(fixes, dict):
+        yield from fixes.items()
+
+class _ChunkReader:
+    """File-like view of response chunks for ijson, from the first '{' on"""
+    
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._started = False
+    
+    def read(self, size=-1):
+        # ijson probes the stream type with read(0)
+        if size == 0:
+            return b''
+        # One chunk per read keeps only the unparsed chunk in memory
+        for chunk in self._chunks:
+            if not self._started:
+                start = chunk.find('{')
+                if start < 0:
+                    continue
+                chunk = chunk[start:]
+                self._started = True
+            if chunk:
+                return chunk.encode('utf-8')
+        return b''
\ No newline at end of file
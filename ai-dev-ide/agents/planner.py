@@ -1,19 +1,10 @@
 """
 Planner Agent - Creates project plans
 """
-import json
-from core.llm import call_llm
+from core import fast_json
+from core.semantic_cache import call_llm_semantic
 
-def planner_agent(prompt, api_url, model):
-    """
-    Create a project plan based on user prompt
-    
-    Args:
-        prompt: User's project description
-        api_url: LLM API URL
-        model: LLM model name
-    """
-    system_prompt = """You are a senior software architect. Create a detailed project plan with:
+SYSTEM_PROMPT = """You are a senior software architect. Create a detailed project plan with:
 1. Project structure
 2. List of files needed
 3. Dependencies required
@@ -29,10 +20,19 @@ Return as JSON with this structure:
   "architecture": "description",
   "steps": ["step1", "step2"]
 }"""
+
+def planner_agent(prompt, api_url, model):
+    """
+    Create a project plan based on user prompt
     
-    full_prompt = f"{system_prompt}\n\nUser request: {prompt}"
+    Args:
+        prompt: User's project description
+        api_url: LLM API URL
+        model: LLM model name
+    """
+    full_prompt = "".join([SYSTEM_PROMPT, "\n\nUser request: ", prompt])
     
-    response = call_llm(full_prompt, api_url, model)
+    response = call_llm_semantic(full_prompt, api_url, model, namespace="plan", key_text=prompt)
     
     try:
         # Try to extract JSON from response
@@ -40,7 +40,7 @@ Return as JSON with this structure:
         end = response.rfind('}') + 1
         if start >= 0 and end > start:
             plan_json = response[start:end]
-            plan = json.loads(plan_json)
+            plan = normalize_plan(fast_json.loads(plan_json), prompt)
         else:
             # Fallback to creating a basic plan
             plan = create_basic_plan(prompt)
@@ -49,6 +49,33 @@ Return as JSON with this structure:
     
     return plan
 
+def normalize_plan(plan, prompt):
+    """
+    Coerce a decoded plan to the expected shape
+    
+    Every key of the basic plan is present with the right type, so
+    agents can use the plan without defensive checks. Extra keys are kept.
+    
+    Raises:
+        ValueError: If the plan is not an object or lists no usable files
+    """
+    if not isinstance(plan, dict):
+        raise ValueError("Plan must be a JSON object")
+    
+    basic = create_basic_plan(prompt)
+    normalized = dict(plan)
+    for key, default in basic.items():
+        value = plan.get(key)
+        if isinstance(default, list):
+            value = [item for item in value if isinstance(item, str)] if isinstance(value, list) else []
+        elif not isinstance(value, str):
+            value = default
+        normalized[key] = value
+    
+    if not normalized["files"]:
+        raise ValueError("Plan lists no files")
+    return normalized
+
 def create_basic_plan(prompt):
     """Create a basic plan if LLM fails"""
     return {
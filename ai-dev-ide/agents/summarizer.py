@@ -2,8 +2,85 @@
 Summarizer Agent - Creates project summaries and updates documentation
 """
 import os
-import json
-from core.llm import call_llm
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from core.semantic_cache import call_llm_semantic, call_llm_semantic_batch
+from core.bulk_io import write_files_bulk
+from core import fast_json
+
+# Threads used to read source files while gathering project info
+SCAN_WORKERS = 16
+
+# Only the top of each file is searched for import statements
+IMPORT_SCAN_LINES = 50
+
+# Substrings in file paths that hint at the technologies in use
+TECH_INDICATORS = {
+    'web': ['flask', 'django', 'fastapi', 'streamlit'],
+    'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch'],
+    'database': ['sqlalchemy', 'psycopg2', 'mysql', 'sqlite'],
+    'testing': ['pytest', 'unittest', 'nose'],
+    'async': ['asyncio', 'aiohttp', 'asyncpg']
+}
+
+_INDICATOR_TO_TECH = {
+    indicator: tech
+    for tech, indicators in TECH_INDICATORS.items()
+    for indicator in indicators
+}
+
+# Longest alternatives first so overlapping names match in full
+_INDICATOR_RE = re.compile("|".join(
+    map(re.escape, sorted(_INDICATOR_TO_TECH, key=len, reverse=True))
+))
+
+# Static parts of the prompts, kept byte-identical across calls
+README_INSTRUCTIONS = """Create a comprehensive README.md for the project described below.
+
+Structure the README with:
+1. Project title and brief description
+2. Features
+3. Installation instructions
+4. Usage examples
+5. Project structure overview
+6. Contributing guidelines
+7. License information
+
+Make it professional and suitable for GitHub.
+
+"""
+
+PORTFOLIO_INSTRUCTIONS = """Create a portfolio-style documentation for the project described below.
+
+Structure the portfolio with:
+1. Project overview and business value
+2. Technical architecture
+3. Key challenges and solutions
+4. Performance metrics
+5. Lessons learned
+6. Future improvements
+7. Screenshots/code snippets (use markdown placeholders)
+
+Make it showcase-worthy for developer portfolios.
+
+"""
+
+SUMMARY_INSTRUCTIONS = """Write two markdown documents for the project described below.
+
+"readme": a comprehensive README.md suitable for GitHub, with a project title and
+brief description, features, installation instructions, usage examples, a project
+structure overview, contributing guidelines and license information.
+
+"portfolio": portfolio-style documentation that is showcase-worthy for developer
+portfolios, with a project overview and business value, technical architecture,
+key challenges and solutions, performance metrics, lessons learned, future
+improvements and screenshots/code snippets (use markdown placeholders).
+
+Return ONLY a JSON object of the form {"readme": "...", "portfolio": "..."}
+with each document as a JSON string.
+
+"""
 
 def summarizer_agent(project_path, api_url, model):
     """
@@ -17,9 +94,8 @@ def summarizer_agent(project_path, api_url, model):
     # Gather project information
     project_info = gather_project_info(project_path)
     
-    # Generate summaries using AI
-    readme_content = generate_readme(project_info, api_url, model)
-    portfolio_content = generate_portfolio(project_info, api_url, model)
+    # Generate both summaries, in a single request when the model cooperates
+    readme_content, portfolio_content = generate_readme_and_portfolio(project_info, api_url, model)
     
     # Save the files
     save_summary_files(project_path, readme_content, portfolio_content)
@@ -41,116 +117,173 @@ def gather_project_info(project_path):
         "dependencies": []
     }
     
-    # Walk through project directory
-    for root, dirs, files in os.walk(project_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            rel_path = os.path.relpath(file_path, project_path)
-            
-            info["files"].append(rel_path)
-            
-            if file.endswith('.py'):
-                info["python_files"].append(rel_path)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        info["total_lines"] += len(lines)
-                        
-                        # Extract imports for dependencies
-                        for line in lines[:50]:  # Check first 50 lines for imports
-                            line = line.strip()
-                            if line.startswith('import ') or line.startswith('from '):
-                                info["dependencies"].append(line)
-                except:
-                    pass
-    
-    # Get unique dependencies
-    info["dependencies"] = list(set(info["dependencies"]))
+    # scandir builds entry paths as project_path + sep + name, so the
+    # relative path is a plain slice
+    project_path = os.fspath(project_path)
+    prefix_len = len(os.path.join(project_path, ""))
+    
+    # List the tree first, then read the Python files in parallel
+    python_paths = []
+    for file_path in iter_project_files(project_path):
+        rel_path = file_path[prefix_len:]
+        info["files"].append(rel_path)
+        
+        if file_path.endswith('.py'):
+            info["python_files"].append(rel_path)
+            python_paths.append(file_path)
+    
+    # File reads are I/O-bound and release the GIL
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for line_count, imports in executor.map(scan_python_file, python_paths):
+            info["total_lines"] += line_count
+            info["dependencies"].extend(imports)
+    
+    # Get unique dependencies, sorted so prompts are identical across runs
+    info["dependencies"] = sorted(set(info["dependencies"]))
     
     # Try to detect main technologies
     detect_technologies(info, project_path)
     
     return info
 
+def iter_project_files(path):
+    """Recursively yield file paths under path using os.scandir"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_project_files(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+    except OSError:
+        pass
+
+def scan_python_file(file_path):
+    """Count lines and collect import statements from the top of a file"""
+    imports = []
+    line_count = 0
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line_count += 1
+                if line_count > IMPORT_SCAN_LINES:
+                    continue
+                line = line.strip()
+                if line.startswith('import ') or line.startswith('from '):
+                    imports.append(line)
+    except (OSError, UnicodeDecodeError):
+        return 0, []
+    return line_count, imports
+
 def detect_technologies(info, project_path):
     """Detect main technologies used in the project"""
-    tech_indicators = {
-        'web': ['flask', 'django', 'fastapi', 'streamlit'],
-        'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch'],
-        'database': ['sqlalchemy', 'psycopg2', 'mysql', 'sqlite'],
-        'testing': ['pytest', 'unittest', 'nose'],
-        'async': ['asyncio', 'aiohttp', 'asyncpg']
-    }
-    
+    info["main_technologies"] = list(_detect_technologies(tuple(info["files"])))
+
+@functools.lru_cache(maxsize=32)
+def _detect_technologies(files):
+    """Map file paths to the set of technologies they hint at"""
     detected = set()
     
-    # Check file names and content for technology indicators
-    for file in info["files"]:
-        file_lower = file.lower()
-        for tech, indicators in tech_indicators.items():
-            for indicator in indicators:
-                if indicator in file_lower:
-                    detected.add(tech)
-                    break
+    # One regex scan per file name instead of a loop over every indicator
+    for file in files:
+        for match in _INDICATOR_RE.finditer(file.lower()):
+            detected.add(_INDICATOR_TO_TECH[match.group()])
+    
+    return frozenset(detected)
+
+def generate_readme_and_portfolio(project_info, api_url, model):
+    """
+    Generate README.md and PORTFOLIO.md content with one LLM call
+    
+    Falls back to separate README and portfolio requests when the
+    combined response isn't the expected JSON object.
+    
+    Returns:
+        Tuple of (readme_content, portfolio_content)
+    """
+    details = f"""Project Information:
+- Files: {len(project_info['files'])} total, {len(project_info['python_files'])} Python files
+- Total lines of code: {project_info['total_lines']}
+- Main technologies: {', '.join(project_info['main_technologies'])}
+- Key dependencies: {', '.join(project_info['dependencies'][:10])}"""
+    
+    prompt = "".join([SUMMARY_INSTRUCTIONS, "Project: ", project_info['name'], "\n\n", details])
+    # Scoped to the project so a similar one's files are never reused
+    response = call_llm_semantic(prompt, api_url, model, ("summary", project_info['name']), details)
+    
+    summary = parse_summary_response(response)
+    if summary:
+        return summary
     
-    info["main_technologies"] = list(detected)
+    readme_content, portfolio_content = call_llm_semantic_batch(
+        [build_readme_request(project_info), build_portfolio_request(project_info)],
+        api_url, model
+    )
+    return readme_content, portfolio_content
+
+def parse_summary_response(response):
+    """Extract (readme, portfolio) from a combined response, or None"""
+    start = response.find('{')
+    end = response.rfind('}')
+    if start == -1 or end <= start:
+        return None
+    
+    try:
+        summary = fast_json.loads(response[start:end + 1])
+    except ValueError:
+        return None
+    
+    if not isinstance(summary, dict):
+        return None
+    readme_content = summary.get("readme")
+    portfolio_content = summary.get("portfolio")
+    if not isinstance(readme_content, str) or not isinstance(portfolio_content, str):
+        return None
+    if not readme_content.strip() or not portfolio_content.strip():
+        return None
+    return readme_content, portfolio_content
 
 def generate_readme(project_info, api_url, model):
     """Generate README.md content"""
-    prompt = f"""Create a comprehensive README.md for the project: {project_info['name']}
+    prompt, namespace, key_text = build_readme_request(project_info)
+    return call_llm_semantic(prompt, api_url, model, namespace, key_text)
 
-Project Information:
+def build_readme_request(project_info):
+    """Build the README prompt as a (prompt, namespace, key_text) request"""
+    details = f"""Project Information:
 - Files: {len(project_info['files'])} total, {len(project_info['python_files'])} Python files
 - Total lines of code: {project_info['total_lines']}
 - Main technologies: {', '.join(project_info['main_technologies'])}
-- Key dependencies: {', '.join(project_info['dependencies'][:10])}
-
-Structure the README with:
-1. Project title and brief description
-2. Features
-3. Installation instructions
-4. Usage examples
-5. Project structure overview
-6. Contributing guidelines
-7. License information
-
-Make it professional and suitable for GitHub."""
+- Key dependencies: {', '.join(project_info['dependencies'][:10])}"""
     
-    return call_llm(prompt, api_url, model)
+    prompt = "".join([README_INSTRUCTIONS, "Project: ", project_info['name'], "\n\n", details])
+    return prompt, ("readme", project_info['name']), details
 
 def generate_portfolio(project_info, api_url, model):
     """Generate PORTFOLIO.md content"""
-    prompt = f"""Create a portfolio-style documentation for the project: {project_info['name']}
+    prompt, namespace, key_text = build_portfolio_request(project_info)
+    return call_llm_semantic(prompt, api_url, model, namespace, key_text)
 
-Project Information:
+def build_portfolio_request(project_info):
+    """Build the portfolio prompt as a (prompt, namespace, key_text) request"""
+    details = f"""Project Information:
 - Files: {len(project_info['files'])} total, {len(project_info['python_files'])} Python files
 - Main technologies: {', '.join(project_info['main_technologies'])}
-- Key features: {', '.join(project_info['dependencies'][:5])}
-
-Structure the portfolio with:
-1. Project overview and business value
-2. Technical architecture
-3. Key challenges and solutions
-4. Performance metrics
-5. Lessons learned
-6. Future improvements
-7. Screenshots/code snippets (use markdown placeholders)
-
-Make it showcase-worthy for developer portfolios."""
+- Key features: {', '.join(project_info['dependencies'][:5])}"""
     
-    return call_llm(prompt, api_url, model)
+    prompt = "".join([PORTFOLIO_INSTRUCTIONS, "Project: ", project_info['name'], "\n\n", details])
+    return prompt, ("portfolio", project_info['name']), details
 
 def save_summary_files(project_path, readme_content, portfolio_content):
     """Save the generated summary files"""
-    # Save README.md
     readme_path = os.path.join(project_path, "README.md")
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    # Save PORTFOLIO.md
     portfolio_path = os.path.join(project_path, "PORTFOLIO.md")
-    with open(portfolio_path, 'w', encoding='utf-8') as f:
-        f.write(portfolio_content)
+    
+    # Both files go out in one batch
+    write_files_bulk({
+        readme_path: readme_content,
+        portfolio_path: portfolio_content
+    })
     
     return {
         "readme_path": readme_path,
@@ -3,9 +3,29 @@ Tester Agent - Generates tests
 """
 import os
 import json
-from core.llm import call_llm
+from core.thread_pool import DaemonThreadPoolExecutor
+from core.llm import call_llm_stream, is_error_response, MAX_CONCURRENT_CALLS
+from core.gen_cache import content_hash, load_gen_cache, save_gen_cache
 
-def tester_agent(project_path, api_url, model):
+# Name of the per-project cache of source hashes -> generated tests
+TEST_CACHE = "test-cache"
+
+# Static part of the prompt, kept byte-identical across calls
+TESTER_INSTRUCTIONS = """Generate comprehensive pytest tests for the Python code below.
+
+Requirements:
+1. Create one test file for the module
+2. Test all functions and classes
+3. Include edge cases
+4. Use pytest fixtures where appropriate
+5. Add setup and teardown if needed
+6. Include docstrings for test functions
+
+Return only the test code, no explanations.
+
+"""
+
+def tester_agent(project_path, api_url, model, progress_callback=None):
     """
     Generate tests for project
     
@@ -13,6 +33,7 @@ def tester_agent(project_path, api_url, model):
         project_path: Path to project
         api_url: LLM API URL
         model: LLM model name
+        progress_callback: Optional callable(done, total, file_path)
     """
     # Find Python files
     python_files = []
@@ -21,37 +42,62 @@ def tester_agent(project_path, api_url, model):
             if file.endswith('.py') and not file.startswith('test_'):
                 python_files.append(os.path.join(root, file))
     
-    for py_file in python_files:
-        generate_tests_for_file(py_file, project_path, api_url, model)
-
-def generate_tests_for_file(file_path, project_path, api_url, model):
-    """Generate tests for a specific file"""
-    # Read the file
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code_content = f.read()
-    except:
-        return
+    # Sources whose hash matches the last run keep their existing tests
+    cache = load_gen_cache(project_path, TEST_CACHE)
+    prefix_len = len(os.path.join(project_path, ""))
+    rel_paths = [py_file[prefix_len:] for py_file in python_files]
     
-    prompt = f"""Generate comprehensive pytest tests for this Python code:
-
-{code_content}
-
-Requirements:
-1. Create test file with name test_{os.path.basename(file_path)}
-2. Test all functions and classes
-3. Include edge cases
-4. Use pytest fixtures where appropriate
-5. Add setup and teardown if needed
-6. Include docstrings for test functions
+    # Each file gets its own LLM call; run them concurrently
+    with DaemonThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS) as executor:
+        futures = [
+            executor.submit(generate_tests_for_file, py_file, project_path, api_url, model, cache.get(rel_path))
+            for py_file, rel_path in zip(python_files, rel_paths)
+        ]
+        for i, (py_file, rel_path, future) in enumerate(zip(python_files, rel_paths, futures)):
+            entry = future.result()
+            if entry:
+                cache[rel_path] = entry
+            if progress_callback:
+                progress_callback(i + 1, len(python_files), py_file)
+    
+    save_gen_cache(project_path, TEST_CACHE, cache)
 
-Return only the test code, no explanations."""
+def generate_tests_for_file(file_path, project_path, api_url, model, cached=None):
+    """
+    Generate tests for a specific file
     
-    tests = call_llm(prompt, api_url, model)
+    Args:
+        cached: Cache entry from a previous run, if any
+    
+    Returns:
+        Cache entry {"hash", "test_path"} for this file, or None on failure
+    """
+    # Read the file
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        code_content = raw.decode('utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
     
-    # Save test file
     test_file_name = f"test_{os.path.basename(file_path)}"
     test_file_path = os.path.join(os.path.dirname(file_path), test_file_name)
     
+    # Unchanged source with its test still on disk: nothing to do
+    source_hash = content_hash(raw)
+    if cached and cached.get("hash") == source_hash and os.path.exists(test_file_path):
+        return cached
+    
+    # Static requirements first, file-specific content last
+    prompt = "".join([TESTER_INSTRUCTIONS, "Test file name: ", test_file_name, "\n\nCode:\n", code_content])
+    
+    # Save test file, writing chunks as they stream in
+    failed = False
     with open(test_file_path, 'w', encoding='utf-8') as f:
-        f.write(tests)
\ No newline at end of file
+        for chunk in call_llm_stream(prompt, api_url, model):
+            failed = failed or is_error_response(chunk)
+            f.write(chunk)
+    
+    if failed:
+        return None
+    return {"hash": source_hash, "test_path": os.path.relpath(test_file_path, project_path)}
\ No newline at end of file
@@ -3,8 +3,13 @@ Main GUI for AI Dev IDE - Refactored and Modular
 """
 import os
 import sys
+import copy
+import types
+import functools
+import threading
+import subprocess
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, Menu, filedialog, simpledialog
 
 # Add module paths
 sys.path.append(os.path.join(os.path.dirname(__file__), 'gui'))
@@ -12,53 +17,141 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'core'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'agents'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
-# Import modular components
-from gui.settings_window import SettingsWindow
+# Import modular components; agents, the settings dialog and GitHub
+# support are imported on first use to keep startup light
 from gui.project_tree import ProjectTree
 from gui.editor_tabs import EditorTabs
 from gui.ai_panel import AIPanel
 from gui.output_panels import OutputPanels
 from core.file_manager import FileManager
-from core.project_state import PROJECT_STATE
-from core.llm import call_llm
-from agents.summarizer import summarizer_agent
-from agents.fixer import fixer_agent
+from core.bulk_io import write_files_bulk, copy_tree_fast, project_file_path
+from core.project_state import PROJECT_STATE, update_plan
 from core.theme_engine import ThemeEngine
+from core.thread_pool import DaemonThreadPoolExecutor
+from core import fast_json
 
-# Try to import GitHub modules
 try:
-    from github.repo import create_github_repo
-    from github.git_ops import git_init_and_push
-    GITHUB_AVAILABLE = True
+    import msgpack
+    MSGPACK_AVAILABLE = True
 except ImportError:
-    GITHUB_AVAILABLE = False
+    MSGPACK_AVAILABLE = False
+
+def freeze_theme(theme):
+    """Read-only theme snapshot with interned keys and string values"""
+    return types.MappingProxyType({
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in theme.items()
+    })
+
+@functools.lru_cache(maxsize=None)
+def github_available():
+    """Try to import the GitHub modules, once, on first use"""
+    try:
+        from github.repo import create_github_repo
+        from github.git_ops import git_init_and_push
+        return True
+    except ImportError:
+        return False
+
+# Milliseconds between checks of the chat busy flag
+BUSY_POLL_MS = 250
+
+# Pool threads: one agent and one script or test run can overlap
+BACKGROUND_WORKERS = 2
+
+# Pool threads for chat and other short UI requests, kept apart so a
+# long script or test run never leaves them queued
+UI_WORKERS = 2
 
 # Settings file
 SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".ai_dev_ide_settings.json")
 
+# Binary copy of the settings, preferred while it is at least as new as the JSON
+SETTINGS_BINARY_PATH = os.path.splitext(SETTINGS_PATH)[0] + ".mp"
+
+# Layout version of the binary copy; a copy with any other is ignored
+SETTINGS_SCHEMA = 1
+
+# Last settings read or written, valid while the file's mtime is unchanged
+_SETTINGS_CACHE = {"mtime": None, "data": None}
+
+def _settings_mtime(path=SETTINGS_PATH):
+    """Modification time of a settings file, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _read_settings(mtime):
+    """Read the settings, from the binary copy when it is current"""
+    if MSGPACK_AVAILABLE:
+        binary_mtime = _settings_mtime(SETTINGS_BINARY_PATH)
+        if binary_mtime is not None and binary_mtime >= mtime:
+            try:
+                with open(SETTINGS_BINARY_PATH, "rb") as f:
+                    saved = msgpack.unpackb(f.read(), raw=False)
+                if isinstance(saved, dict) and saved.get("_schema") == SETTINGS_SCHEMA:
+                    return saved["settings"]
+            except Exception:
+                pass
+    
+    with open(SETTINGS_PATH, "rb") as f:
+        settings = fast_json.loads(f.read())
+    
+    # Refresh a missing, stale or outdated binary copy for the next start
+    _write_binary_settings(settings)
+    return settings
+
+def _write_binary_settings(settings):
+    """Write the binary copy of the settings, if msgpack is installed"""
+    if MSGPACK_AVAILABLE:
+        try:
+            data = msgpack.packb({"_schema": SETTINGS_SCHEMA, "settings": settings}, use_bin_type=True)
+            _write_atomic(SETTINGS_BINARY_PATH, data)
+        except Exception:
+            pass
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temporary file and os.replace"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 def load_settings():
     """Load settings from file and ensure all theme keys exist"""
-    import json
-    if os.path.exists(SETTINGS_PATH):
+    mtime = _settings_mtime()
+    if mtime is None:
+        loaded_settings = {}
+    elif mtime == _SETTINGS_CACHE["mtime"]:
+        loaded_settings = copy.deepcopy(_SETTINGS_CACHE["data"])
+    else:
         try:
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                loaded_settings = json.load(f)
+            loaded_settings = _read_settings(mtime)
+            if not isinstance(loaded_settings, dict):
+                loaded_settings = {}
         except:
             loaded_settings = {}
-    else:
-        loaded_settings = {}
+        _SETTINGS_CACHE["mtime"] = mtime
+        _SETTINGS_CACHE["data"] = copy.deepcopy(loaded_settings)
     
     loaded_settings["theme"] = loaded_settings.get("theme", {})
     return loaded_settings
 
 def save_settings(settings):
-    """Save settings to file"""
-    import json
+    """Save settings to file, returning whether the write succeeded"""
     try:
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        _write_atomic(SETTINGS_PATH, fast_json.dumps(settings, indent=True).encode("utf-8"))
     except:
-        pass
+        return False
+    
+    # Written second so its mtime marks it as current
+    _write_binary_settings(settings)
+    
+    # The next load can use what was just written
+    _SETTINGS_CACHE["mtime"] = _settings_mtime()
+    _SETTINGS_CACHE["data"] = copy.deepcopy(settings)
+    return True
 
 class AIDevIDE:
     def __init__(self, root, settings=None, theme_engine=None):
@@ -70,7 +163,7 @@ class AIDevIDE:
         theme_data = self.settings.get("theme", self.theme_engine.create_dark_theme())
         normalized_theme = self.theme_engine.normalize_theme(theme_data)
         self.theme_engine.apply_theme(normalized_theme)
-        self.theme = self.theme_engine.to_legacy_theme()
+        self.theme = freeze_theme(self.theme_engine.to_legacy_theme())
         
         # Initialize components
         self.file_manager = FileManager()
@@ -78,9 +171,35 @@ class AIDevIDE:
         self.is_running_agent = False
         self.ai_suggested_changes = {}
         
+        # Agents and script runs share a small pool of reusable threads;
+        # chat and connection tests have their own
+        self._executor = DaemonThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="aidev")
+        self._ui_executor = DaemonThreadPoolExecutor(max_workers=UI_WORKERS, thread_name_prefix="aidev_ui")
+        self._agent_future = None
+        self._processes = set()
+        
+        # Settings snapshot waiting for the writer thread, newest wins
+        self._pending_settings = None
+        self._settings_writing = False
+        self._settings_lock = threading.Lock()
+        
+        # Progress updates from workers are coalesced into one per idle cycle
+        self._pending_progress = None
+        self._progress_scheduled = False
+        self._pbar_running = False
+        
+        # Set by workers while chat waits on the model; polled by the UI
+        self.ai_busy = threading.Event()
+        self._busy_shown = False
+        
+        # Theme most recently pushed to the widgets, to skip no-op passes
+        self._applied_theme = None
+        self._style = None
+        
         # Setup GUI
         self.setup_gui()
         self.apply_theme_to_all()
+        self.root.after(BUSY_POLL_MS, self._poll_busy)
         
     def setup_gui(self):
         """Setup the main GUI window"""
@@ -97,7 +216,6 @@ class AIDevIDE:
         
     def setup_menu(self):
         """Setup the top menu/controls"""
-        from tkinter import Menu
         menubar = Menu(self.root)
         self.root.config(menu=menubar)
         
@@ -138,28 +256,26 @@ class AIDevIDE:
         tools_menu.add_command(label="Settings", command=self.open_settings)
         tools_menu.add_command(label="Run Script", command=self.save_and_run)
         tools_menu.add_command(label="Run Tests", command=self.run_tests_and_show)
-        if GITHUB_AVAILABLE:
-            tools_menu.add_command(label="Push to GitHub", command=self.push_to_github)
+        # Availability is checked on click, so startup doesn't import GitHub support
+        tools_menu.add_command(label="Push to GitHub", command=self.push_to_github)
         
     def setup_status_bar(self):
         """Setup the status bar"""
         self.status_frame = ttk.Frame(self.root)
         self.status_frame.pack(fill="x", padx=6, pady=(6,4))
         
-        self.status_label = ttk.Label(self.status_frame, text="Ready", font=(self.theme["FONT_FAMILY"], 10))
+        font_family = self.theme["FONT_FAMILY"]
+        self.status_label = ttk.Label(self.status_frame, text="Ready", font=(font_family, 10))
         self.status_label.pack(side="left", fill="x", expand=True)
         
         self.progress_bar = ttk.Progressbar(self.status_frame, mode='indeterminate', length=200)
         self.progress_bar.pack(side="right", padx=(6,0))
         
-        self.progress_text = ttk.Label(self.status_frame, text="", font=(self.theme["FONT_FAMILY"], 9))
+        self.progress_text = ttk.Label(self.status_frame, text="", font=(font_family, 9))
         self.progress_text.pack(side="right", padx=(0,6))
     
     def setup_main_panes(self):
         """Setup the main panes (tree, editor, AI panel)"""
-        import tkinter as tk
-        from tkinter import ttk
-        
         # Main horizontal panes
         main_pane = ttk.Panedwindow(self.root, orient="horizontal")
         main_pane.pack(fill="both", expand=True, padx=6, pady=4)
@@ -192,24 +308,35 @@ class AIDevIDE:
     def apply_theme_to_all(self):
         """Apply theme to all components"""
         # Refresh legacy theme snapshot for existing widgets
-        self.theme = self.theme_engine.to_legacy_theme()
+        self.theme = freeze_theme(self.theme_engine.to_legacy_theme())
+        
+        # Nothing to do if the widgets already show this theme
+        theme_items = frozenset(self.theme.items())
+        if theme_items == self._applied_theme:
+            return
+        changed_keys = {key for key, _ in theme_items - (self._applied_theme or frozenset())}
+        self._applied_theme = theme_items
+        
         self.root.configure(bg=self.theme["BG"])
         
         # Configure ttk style for frames, labels, buttons, etc.
-        style = ttk.Style()
-        style.configure("TFrame", background=self.theme["FRAME_BG"])
-        style.configure("TLabel", background=self.theme["LABEL_BG"], foreground=self.theme["FG"])
-        style.configure("TButton", background=self.theme["BTN"])
-        style.map("TButton", background=[('active', self.theme["BTN_ACTIVE"])])
-        style.configure("TLabelFrame", background=self.theme["FRAME_BG"], foreground=self.theme["FG"])
-        style.configure("TNotebook", background=self.theme["FRAME_BG"])
-        style.configure("TNotebook.Tab", background=self.theme["PANEL_BG"], foreground=self.theme["FG"])
+        if changed_keys & {"FRAME_BG", "LABEL_BG", "FG", "BTN", "BTN_ACTIVE", "PANEL_BG"}:
+            if self._style is None:
+                self._style = ttk.Style()
+            style = self._style
+            style.configure("TFrame", background=self.theme["FRAME_BG"])
+            style.configure("TLabel", background=self.theme["LABEL_BG"], foreground=self.theme["FG"])
+            style.configure("TButton", background=self.theme["BTN"])
+            style.map("TButton", background=[('active', self.theme["BTN_ACTIVE"])])
+            style.configure("TLabelFrame", background=self.theme["FRAME_BG"], foreground=self.theme["FG"])
+            style.configure("TNotebook", background=self.theme["FRAME_BG"])
+            style.configure("TNotebook.Tab", background=self.theme["PANEL_BG"], foreground=self.theme["FG"])
         
         # Apply to specific components
         if hasattr(self, 'project_tree'):
             self.project_tree.apply_theme(self.theme)
         if hasattr(self, 'editor_tabs'):
-            self.editor_tabs.apply_theme_to_all()
+            self.editor_tabs.apply_theme(self.theme)
         if hasattr(self, 'ai_panel'):
             self.ai_panel.apply_theme(self.theme)
         if hasattr(self, 'output_panels'):
@@ -221,29 +348,52 @@ class AIDevIDE:
     
     def update_progress(self, message, show_progress_bar=True):
         """Update progress status"""
-        self.root.after(0, lambda: self._update_progress_ui(message, show_progress_bar))
+        # Only the latest update matters; schedule at most one flush
+        self._pending_progress = (message, show_progress_bar)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after_idle(self._flush_progress)
+    
+    def _flush_progress(self):
+        # Clear the flag before taking the update so none is ever lost
+        self._progress_scheduled = False
+        pending, self._pending_progress = self._pending_progress, None
+        if pending:
+            self._update_progress_ui(*pending)
     
     def _update_progress_ui(self, message, show_progress_bar):
         self.status_label.config(text=message)
         self.progress_text.config(text=message[:40] + "..." if len(message) > 40 else message)
         
-        if show_progress_bar:
-            self.progress_bar.start()
-        else:
-            self.progress_bar.stop()
+        # Progressbar.start reschedules its timer on every call
+        if show_progress_bar != self._pbar_running:
+            if show_progress_bar:
+                self.progress_bar.start()
+            else:
+                self.progress_bar.stop()
+            self._pbar_running = show_progress_bar
+    
+    def _poll_busy(self):
+        """Show or clear the chat busy state when the flag has changed"""
+        busy = self.ai_busy.is_set()
+        if busy != self._busy_shown:
+            self._busy_shown = busy
+            if busy:
+                self._update_progress_ui("AI thinking...", True)
+            elif not self.is_running_agent:
+                self.clear_progress()
+        self.root.after(BUSY_POLL_MS, self._poll_busy)
     
     def clear_progress(self):
         """Clear progress indicators"""
         self.status_label.config(text="Ready")
         self.progress_text.config(text="")
         self.progress_bar.stop()
+        self._pbar_running = False
     
     # Project methods
     def new_project(self):
         """Create a new project"""
-        from tkinter import filedialog, simpledialog
-        import os
-        
         folder = filedialog.askdirectory(title="Select Folder for New Project")
         if not folder:
             return
@@ -255,15 +405,15 @@ class AIDevIDE:
         self.project_path = os.path.join(folder, project_name)
         os.makedirs(self.project_path, exist_ok=True)
         
-        # Create basic files
-        with open(os.path.join(self.project_path, "README.md"), "w") as f:
-            f.write(f"# {project_name}\n\nCreated with AI Dev IDE\n")
-        
-        with open(os.path.join(self.project_path, "main.py"), "w") as f:
-            f.write('# Main file\nprint("Hello from AI Dev IDE")')
-        
-        with open(os.path.join(self.project_path, "PORTFOLIO.md"), "w") as f:
-            f.write(f"# {project_name} - Portfolio\n\n## Project Description\n\nThis project was created using AI Dev IDE.\n")
+        # Create basic files in one batch
+        write_files_bulk({
+            os.path.join(self.project_path, "README.md"):
+                f"# {project_name}\n\nCreated with AI Dev IDE\n",
+            os.path.join(self.project_path, "main.py"):
+                '# Main file\nprint("Hello from AI Dev IDE")',
+            os.path.join(self.project_path, "PORTFOLIO.md"):
+                f"# {project_name} - Portfolio\n\n## Project Description\n\nThis project was created using AI Dev IDE.\n"
+        })
         
         # Load the new project
         self.project_tree.load_project(self.project_path)
@@ -271,9 +421,6 @@ class AIDevIDE:
     
     def open_existing_project(self):
         """Open an existing project"""
-        from tkinter import filedialog
-        import os
-        
         folder = filedialog.askdirectory(title="Select Project Folder")
         if not folder:
             return
@@ -289,23 +436,20 @@ class AIDevIDE:
         if not self.project_path:
             return
         
-        import os
-        
-        # Check and create README.md
-        readme_path = os.path.join(self.project_path, "README.md")
-        if not os.path.exists(readme_path):
-            with open(readme_path, "w", encoding="utf-8") as f:
-                project_name = os.path.basename(self.project_path)
-                f.write(f"# {project_name}\n\n## Project Overview\n\nThis project was created using AI Dev IDE.\n")
-            self.log_ai("Created README.md")
+        project_name = os.path.basename(self.project_path)
+        docs = {
+            "README.md": f"# {project_name}\n\n## Project Overview\n\nThis project was created using AI Dev IDE.\n",
+            "PORTFOLIO.md": f"# {project_name} - Portfolio\n\n## Project Description\n\nAI-generated project demonstrating modern development practices.\n"
+        }
         
-        # Check and create PORTFOLIO.md
-        portfolio_path = os.path.join(self.project_path, "PORTFOLIO.md")
-        if not os.path.exists(portfolio_path):
-            with open(portfolio_path, "w", encoding="utf-8") as f:
-                project_name = os.path.basename(self.project_path)
-                f.write(f"# {project_name} - Portfolio\n\n## Project Description\n\nAI-generated project demonstrating modern development practices.\n")
-            self.log_ai("Created PORTFOLIO.md")
+        for doc_name, content in docs.items():
+            # 'x' creates the file only if it is missing, in a single open
+            try:
+                with open(os.path.join(self.project_path, doc_name), "x", encoding="utf-8") as f:
+                    f.write(content)
+            except FileExistsError:
+                continue
+            self.log_ai(f"Created {doc_name}")
     
     # Agent methods
     def run_agent(self, agent_type):
@@ -318,8 +462,6 @@ class AIDevIDE:
             self.show_message("No Project", "Please open or create a project first.")
             return
         
-        from tkinter import simpledialog
-        
         prompts = {
             "plan": "Create a project plan",
             "code": "Generate code for planned project",
@@ -336,11 +478,8 @@ class AIDevIDE:
         if not prompt:
             return
         
-        self.is_running_agent = True
         self.update_progress(f"Starting {agent_type} agent...", True)
         
-        import threading
-        
         def worker():
             try:
                 api_url = self.settings.get("api_url", "http://localhost:11434/api/generate")
@@ -349,24 +488,32 @@ class AIDevIDE:
                 if agent_type == "plan":
                     from agents.planner import planner_agent
                     plan = planner_agent(prompt, api_url, model)
-                    PROJECT_STATE['plan'] = plan
+                    update_plan(plan)
                     self.update_progress(f"Plan created with {len(plan.get('files', []))} files", False)
                     
                 elif agent_type == "code":
                     from agents.coder import coder_agent
                     files = PROJECT_STATE.get('plan', {}).get('files', ['main.py'])
-                    for i, fname in enumerate(files):
-                        self.update_progress(f"Generating {fname} ({i+1}/{len(files)})...", True)
-                        coder_agent(self.project_path, api_url, model)
+                    self.update_progress(f"Generating {len(files)} files...", True)
+                    coder_agent(
+                        self.project_path, api_url, model,
+                        progress_callback=lambda done, total, fname: self.update_progress(
+                            f"Generated {fname} ({done}/{total})...", True)
+                    )
                     self.update_progress(f"Generated {len(files)} files", False)
                     
                 elif agent_type == "test":
                     from agents.tester import tester_agent
-                    tester_agent(self.project_path, api_url, model)
+                    tester_agent(
+                        self.project_path, api_url, model,
+                        progress_callback=lambda done, total, path: self.update_progress(
+                            f"Tests for {os.path.basename(path)} ({done}/{total})...", True)
+                    )
                     self.update_progress("Tests generated", False)
                     
                 elif agent_type == "summarize":
                     # Use the updated summarizer agent
+                    from agents.summarizer import summarizer_agent
                     summarizer_agent(self.project_path, api_url, model)
                     self.update_progress("Project summarized", False)
                     
@@ -376,11 +523,8 @@ class AIDevIDE:
                 self.update_progress(f"Error in {agent_type} agent", False)
                 self.log_ai(f"{agent_type.capitalize()} agent error: {e}")
                 self.show_message("Agent Error", f"{agent_type.capitalize()} agent failed: {e}")
-            finally:
-                self.is_running_agent = False
-                self.clear_progress()
         
-        threading.Thread(target=worker, daemon=True).start()
+        self.submit_agent(worker)
     
     def suggest_fixes(self):
         """Use AI to suggest fixes for errors"""
@@ -392,15 +536,16 @@ class AIDevIDE:
             self.show_message("Busy", "Please wait for current operation to complete.")
             return
         
-        error_log = self.output_panels.script_output.get("1.0", "end-1c").strip()
+        error_log = self.output_panels.get_script_tail().strip()
         if not error_log:
             self.log_ai("No script output to use for fixes. Run a script first.")
             return
         
-        self.is_running_agent = True
         self.update_progress("Analyzing errors...", True)
         
-        import threading
+        # Fixes are shown one by one as the response is parsed
+        self.ai_suggested_changes = {}
+        self.ai_panel.clear_suggestions()
         
         def worker():
             try:
@@ -408,17 +553,17 @@ class AIDevIDE:
                 selected_files = self.ai_panel.get_selected_files() or list(self.editor_tabs.get_open_files())
                 
                 # Use the fixer agent
+                from agents.fixer import fixer_agent
                 fixes = fixer_agent(
                     self.project_path,
                     selected_files,
                     error_log,
                     self.settings.get("api_url", ""),
-                    self.settings.get("model", "")
+                    self.settings.get("model", ""),
+                    on_fix=lambda filename, content: self.root.after(0, self._add_suggested_fix, filename, content)
                 )
                 
                 if fixes:
-                    self.ai_suggested_changes = fixes
-                    self.ai_panel.display_suggested_changes(fixes)
                     self.update_progress(f"Found {len(fixes)} potential fixes", False)
                 else:
                     self.update_progress("No fixes found", False)
@@ -428,11 +573,42 @@ class AIDevIDE:
                 self.update_progress("Fixer error", False)
                 self.log_ai(f"Fixer error: {e}")
                 self.show_message("Fixer Error", f"Fixer failed: {e}")
-            finally:
-                self.is_running_agent = False
-                self.clear_progress()
         
-        threading.Thread(target=worker, daemon=True).start()
+        self.submit_agent(worker)
+    
+    def _add_suggested_fix(self, filename, content):
+        self.ai_suggested_changes[filename] = content
+        self.ai_panel.add_suggested_change(filename, content)
+    
+    def run_in_background(self, func, *args):
+        """Run a short UI request func(*args) on the UI pool, returning its Future"""
+        return self._submit(self._ui_executor, func, *args)
+    
+    def submit_agent(self, worker):
+        """Run an agent worker on the pool; only one agent runs at a time"""
+        self.is_running_agent = True
+        self._agent_future = self._submit(self._executor, worker)
+        # Runs however the worker ends, including if it is cancelled
+        self._agent_future.add_done_callback(lambda future: self.root.after(0, self._on_agent_done))
+    
+    def _submit(self, executor, func, *args):
+        future = executor.submit(func, *args)
+        future.add_done_callback(self._on_worker_done)
+        return future
+    
+    def _on_worker_done(self, future):
+        """Log an exception that escaped a worker's own error handling"""
+        if future.cancelled() or future.exception() is None:
+            return
+        try:
+            self.root.after(0, self.log_ai, f"Background task failed: {future.exception()!r}")
+        except (RuntimeError, tk.TclError):
+            pass  # The window has already closed
+    
+    def _on_agent_done(self):
+        self.is_running_agent = False
+        self._agent_future = None
+        self.clear_progress()
     
     def apply_ai_changes(self):
         """Apply AI suggested changes"""
@@ -440,40 +616,48 @@ class AIDevIDE:
             self.show_message("No Changes", "No AI changes to apply.")
             return
         
-        applied = 0
-        for fname, new_content in self.ai_suggested_changes.items():
+        # Write every suggested file in one batch
+        base = os.path.join(self.project_path, "")
+        full_paths = {}
+        for fname in self.ai_suggested_changes:
             try:
-                full_path = os.path.join(self.project_path, fname)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                
-                with open(full_path, "w", encoding="utf-8") as fh:
-                    fh.write(new_content)
-                
-                # Update editor if open
-                if fname in self.editor_tabs.get_open_files():
-                    self.editor_tabs.update_file_content(fname, new_content)
-                
-                applied += 1
-                self.log_ai(f"Applied changes to: {fname}")
-                
-            except Exception as e:
-                self.log_ai(f"Error applying changes to {fname}: {e}")
+                full_paths[fname] = project_file_path(base, fname)
+            except ValueError as e:
+                self.log_ai(f"Skipped {fname}: {e}")
+        failures = write_files_bulk(
+            {full_paths[fname]: content for fname, content in self.ai_suggested_changes.items() if fname in full_paths},
+            raise_errors=False
+        )
         
-        if applied > 0:
-            self.show_message("Changes Applied", f"Applied {applied} file(s) from AI suggestions.")
+        applied = []
+        for fname, new_content in self.ai_suggested_changes.items():
+            if fname not in full_paths:
+                continue
+            error = failures.get(full_paths[fname])
+            if error is not None:
+                self.log_ai(f"Error applying changes to {fname}: {error}")
+                continue
+            
+            # Update editor if open
+            if fname in self.editor_tabs.get_open_files():
+                self.editor_tabs.update_file_content(fname, new_content)
+            
+            applied.append(fname)
+            self.log_ai(f"Applied changes to: {fname}")
+        
+        if applied:
+            self.show_message("Changes Applied", f"Applied {len(applied)} file(s) from AI suggestions.")
             self.ai_suggested_changes = {}
-            self.project_tree.refresh()
+            self.project_tree.refresh_paths(applied)
         else:
             self.show_message("No Changes Applied", "No changes were applied.")
     
     # Settings
     def open_settings(self):
-        """Open the settings window"""
-        if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
-            self.settings_window.lift()
-            return
-        
-        self.settings_window = SettingsWindow(self.root, self)
+        """Open the settings window, reusing it after the first time"""
+        if getattr(self, 'settings_window', None) is None:
+            from gui.settings_window import SettingsWindow
+            self.settings_window = SettingsWindow(self.root, self)
         self.settings_window.show()
     
     def save_settings(self, new_settings):
@@ -483,9 +667,39 @@ class AIDevIDE:
         normalized = self.theme_engine.normalize_theme(theme_data)
         self.theme_engine.apply_theme(normalized)
         self.settings["theme"] = normalized
-        save_settings(self.settings)
+        self.write_settings_async()
         self.apply_theme_to_all()
     
+    def write_settings_async(self):
+        """
+        Write a snapshot of the settings to disk off the UI thread
+        
+        Saves made while a write is running collapse into one write of
+        the newest snapshot. The writer is not a daemon thread, so a save
+        made while closing still completes.
+        """
+        snapshot = copy.deepcopy(self.settings)
+        with self._settings_lock:
+            self._pending_settings = snapshot
+            start = not self._settings_writing
+            self._settings_writing = True
+        if start:
+            threading.Thread(target=self._settings_writer, name="aidev-settings").start()
+    
+    def _settings_writer(self):
+        while True:
+            with self._settings_lock:
+                settings = self._pending_settings
+                self._pending_settings = None
+                if settings is None:
+                    self._settings_writing = False
+                    return
+            if not save_settings(settings):
+                try:
+                    self.root.after(0, self.log_ai, f"Could not save settings to {SETTINGS_PATH}")
+                except (RuntimeError, tk.TclError):
+                    pass  # The window has already closed
+    
     # Utility methods
     def save_all_open_files(self):
         """Save all open files"""
@@ -507,26 +721,13 @@ class AIDevIDE:
             self.log_script(f"Script not found: {target}")
             return
         
-        import threading
-        import subprocess
-        
         def worker():
             self.update_progress(f"Running {target}...", True)
             try:
-                result = subprocess.run(
-                    ["python", target],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                self.output_panels.clear_script_output()
-                self.log_script(result.stdout)
-                if result.stderr:
-                    self.log_script(f"Errors:\n{result.stderr}")
+                # -u so the script's output arrives line by line, not at exit
+                returncode = self.stream_process(["python", "-u", target], timeout=60)
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.update_progress("Script executed successfully", False)
                 else:
                     self.update_progress("Script failed", False)
@@ -535,7 +736,7 @@ class AIDevIDE:
                 self.log_script(f"Error running script: {e}")
                 self.update_progress("Script error", False)
         
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit(self._executor, worker)
     
     def run_tests_and_show(self):
         """Run tests and show results"""
@@ -543,51 +744,93 @@ class AIDevIDE:
             self.show_message("No Project", "Please open or create a project first.")
             return
         
-        import threading
-        import subprocess
-        
         def worker():
             self.update_progress("Running tests...", True)
             try:
-                result = subprocess.run(
-                    ["python", "-m", "pytest", "-v"],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                
-                self.output_panels.clear_script_output()
-                self.log_script(result.stdout)
-                if result.stderr:
-                    self.log_script(f"Test errors:\n{result.stderr}")
-                
+                self.stream_process(["python", "-u", "-m", "pytest", "-v"], timeout=120)
                 self.update_progress("Tests completed", False)
                 
             except Exception as e:
                 self.log_script(f"Error running tests: {e}")
                 self.update_progress("Test error", False)
         
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit(self._executor, worker)
+    
+    def stream_process(self, cmd, timeout):
+        """
+        Run cmd in the project folder, streaming its output to the script panel
+        
+        Meant to be called from a worker thread. stderr is merged into
+        stdout so both appear in the order they were written.
+        
+        Returns:
+            The process exit code
+        
+        Raises:
+            subprocess.TimeoutExpired: If the process ran longer than timeout
+        """
+        # Clear the panel before queueing output so none of it is cleared too
+        cleared = threading.Event()
+        
+        def clear():
+            self.output_panels.clear_script_output()
+            cleared.set()
+        
+        self.root.after(0, clear)
+        cleared.wait()
+        
+        process = subprocess.Popen(
+            cmd,
+            cwd=self.project_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1
+        )
+        timed_out = []
+        
+        def kill():
+            timed_out.append(True)
+            process.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        self._processes.add(process)
+        try:
+            # The output panel batches queued lines into timed flushes
+            for line in process.stdout:
+                self.output_panels.log_script(line)
+            returncode = process.wait()
+        except BaseException:
+            # Don't leave the process running with no one reading it
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            timer.cancel()
+            self._processes.discard(process)
+            process.stdout.close()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode
     
     def export_project(self):
         """Export the project"""
-        from tkinter import filedialog
-        
         folder = filedialog.askdirectory(title="Export Project")
         if not folder:
             return
         
-        import shutil
         try:
-            shutil.copytree(self.project_path, os.path.join(folder, os.path.basename(self.project_path)))
+            copy_tree_fast(self.project_path, os.path.join(folder, os.path.basename(self.project_path)))
             self.show_message("Export Complete", f"Project exported to {folder}")
         except Exception as e:
             self.show_message("Export Error", f"Failed to export project: {e}")
     
     def push_to_github(self):
         """Push project to GitHub"""
-        if not GITHUB_AVAILABLE:
+        if not github_available():
             self.show_message("GitHub Not Available", "GitHub modules are not installed.")
             return
         
@@ -611,6 +854,12 @@ class AIDevIDE:
     def on_close(self):
         """Handle window close"""
         self.save_settings(self.settings)
+        # Drop queued work and stop running scripts; pool threads are
+        # daemons, so a running agent doesn't keep the process alive
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._ui_executor.shutdown(wait=False, cancel_futures=True)
+        for process in list(self._processes):
+            process.kill()
         self.root.destroy()
 
 def main():
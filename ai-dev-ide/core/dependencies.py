@@ -3,31 +3,59 @@ Dependency Management
 """
 import subprocess
 import sys
-import pkg_resources
 import os
+import re
+from importlib.metadata import distributions
+
+# packaging parses extras, markers and URLs in requirement lines correctly
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+# The distribution name ends at the first specifier, marker, extra or URL
+_REQ_SPLIT = re.compile(r"[<>=!~;\[@\s]")
+
+# Canonical names of installed distributions, built on first use
+_INSTALLED = None
+
+def canonicalize_name(name):
+    """Normalize a distribution name so 'Foo_Bar' and 'foo-bar' compare equal"""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+def _get_installed_set():
+    """Set of canonical installed distribution names, scanned once"""
+    global _INSTALLED
+    if _INSTALLED is None:
+        _INSTALLED = frozenset(
+            canonicalize_name(dist.metadata["Name"])
+            for dist in distributions()
+            if dist.metadata["Name"]
+        )
+    return _INSTALLED
 
 def check_dependency(package_name):
     """Check if package is installed"""
-    try:
-        pkg_resources.get_distribution(package_name)
-        return True
-    except:
-        return False
+    return canonicalize_name(package_name) in _get_installed_set()
 
 def install_dependency(package_name):
     """Install a package"""
+    global _INSTALLED
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
         return True
     except:
         return False
+    finally:
+        # Even a failed install may have changed what is installed
+        _INSTALLED = None
 
 def get_installed_packages():
     """Get list of installed packages"""
-    installed = []
-    for dist in pkg_resources.working_set:
-        installed.append(dist.key)
-    return installed
+    return list(_get_installed_set())
 
 def check_project_dependencies(project_path):
     """Check project dependencies from requirements.txt"""
@@ -35,17 +63,35 @@ def check_project_dependencies(project_path):
     missing = []
     
     if os.path.exists(req_file):
+        # One scan of installed distributions, then set lookups per line
+        installed = _get_installed_set()
         with open(req_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # Parse package name (remove version specifiers)
-                    package_name = line.split('==')[0].split('>=')[0].split('<=')[0].strip()
-                    if not check_dependency(package_name):
-                        missing.append(package_name)
+            names = (parse_requirement_name(line) for line in f)
+            missing = [
+                name for name in names
+                if name and canonicalize_name(name) not in installed
+            ]
     
     return missing
 
+def parse_requirement_name(line):
+    """
+    Extract the distribution name from a requirements.txt line
+    
+    Returns:
+        The name, or None for blank lines, comments and pip options
+    """
+    line = line.split(' #', 1)[0].strip()
+    if not line or line.startswith(('#', '-')):
+        return None
+    
+    if PACKAGING_AVAILABLE:
+        try:
+            return Requirement(line).name
+        except InvalidRequirement:
+            pass
+    return _REQ_SPLIT.split(line, 1)[0] or None
+
 def generate_requirements(project_path, packages):
     """Generate requirements.txt file"""
     req_file = os.path.join(project_path, "requirements.txt")
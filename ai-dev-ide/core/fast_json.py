@@ -0,0 +1,41 @@
+"""
+Fast JSON - orjson when installed, the standard library otherwise
+"""
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dumps(obj, indent=False):
+    """
+    Serialize obj to a JSON string
+    
+    Both backends produce the same text: UTF-8 rather than \\u escapes,
+    compact separators, or two-space indentation when indent is set.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+def dumpb(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, e.g. for a request body"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def loads(data):
+    """
+    Parse JSON from str or bytes
+    
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
\ No newline at end of file
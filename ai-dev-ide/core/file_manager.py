@@ -3,76 +3,251 @@ File Management Utilities
 """
 import os
 import json
-import hashlib
+import fnmatch
+from collections import OrderedDict
+from core.gen_cache import content_hash, file_hash
+from core.bulk_io import encode_text, write_files_bulk, project_file_path
+
+# pathspec implements the full .gitignore syntax
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
+# Upper bound on raw file contents held in memory, in bytes
+MAX_CACHE_SIZE = 64 * 1024 * 1024
+
+# Decoded text is only kept for the most recently read files
+MAX_TEXT_ENTRIES = 32
+
+# Directories never worth descending into when searching a project
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules',
+    'venv', '.venv', '.tox', '.mypy_cache', '.pytest_cache'
+})
+
+def normalize_newlines(text):
+    """Translate \\r\\n and \\r to \\n, as reading in text mode does"""
+    if '\r' in text:
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def load_gitignore(directory):
+    """
+    Build a matcher for the .gitignore at the root of directory
+    
+    Returns:
+        Callable(rel_path, is_dir) -> bool, or None if there is no .gitignore
+    """
+    try:
+        with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    if PATHSPEC_AVAILABLE:
+        spec = pathspec.PathSpec.from_lines('gitwildmatch', lines)
+        return lambda rel_path, is_dir: spec.match_file(rel_path + '/' if is_dir else rel_path)
+    
+    # Without pathspec, honour the common case of plain name patterns
+    # ("*.pyc", "build/") and skip anything path-anchored or negated
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(('#', '!')) or '/' in line.rstrip('/'):
+            continue
+        patterns.append((line.rstrip('/'), line.endswith('/')))
+    if not patterns:
+        return None
+    
+    def matcher(rel_path, is_dir):
+        name = rel_path.rsplit('/', 1)[-1]
+        return any(
+            fnmatch.fnmatchcase(name, pattern)
+            for pattern, dir_only in patterns
+            if is_dir or not dir_only
+        )
+    return matcher
 
 class FileManager:
-    def __init__(self):
-        self.file_cache = {}
-        self.file_hashes = {}
+    def __init__(self, max_cache_size=MAX_CACHE_SIZE):
+        self.file_cache = OrderedDict()  # path -> bytes, least recently used first
+        self.text_cache = OrderedDict()  # path -> decoded str for hot files
+        self.cache_size = 0
+        self.max_cache_size = max_cache_size
+        self.file_meta = {}  # path -> (mtime_ns, size, hash) of the bytes on disk
 
-    def read_file(self, file_path):
-        """Read file with caching"""
+    def read_bytes(self, file_path):
+        """Read raw file contents with caching; None if unreadable"""
         if file_path in self.file_cache:
+            self.file_cache.move_to_end(file_path)
             return self.file_cache[file_path]
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.file_cache[file_path] = content
-                self.file_hashes[file_path] = self.calculate_hash(content)
-                return content
-        except:
+            with open(file_path, 'rb') as f:
+                # Stat before reading, so a write racing the read is noticed later
+                st = os.fstat(f.fileno())
+                data = f.read()
+            self._cache_bytes(file_path, data)
+            self._remember(file_path, data, st)
+            return data
+        except OSError:
+            # Not cached, so the file is read again once it exists
+            return None
+
+    def read_file(self, file_path):
+        """Read file with caching"""
+        if file_path in self.text_cache:
+            self.text_cache.move_to_end(file_path)
+            return self.text_cache[file_path]
+        
+        data = self.read_bytes(file_path)
+        if data is None:
+            return ""
+        try:
+            content = normalize_newlines(data.decode('utf-8'))
+        except UnicodeDecodeError:
             return ""
+        
+        self._cache_text(file_path, content)
+        return content
 
     def write_file(self, file_path, content):
-        """Write file and update cache"""
+        """Write str or bytes to a file and update cache"""
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Encode once, with the newline translation text mode would apply
+            data = encode_text(content)
+            with open(file_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                st = os.fstat(f.fileno())
             
-            self.file_cache[file_path] = content
-            self.file_hashes[file_path] = self.calculate_hash(content)
+            # Both caches come from the one buffer that was written
+            self._cache_bytes(file_path, data)
+            if isinstance(content, str):
+                # As a cold read_file would return it
+                self._cache_text(file_path, normalize_newlines(content))
+            else:
+                self.text_cache.pop(file_path, None)
+            self._remember(file_path, data, st)
             return True
         except Exception as e:
             return False
 
+    def _cache_bytes(self, file_path, data):
+        """Cache data as most recently used, evicting the coldest files"""
+        old = self.file_cache.pop(file_path, None)
+        if old is not None:
+            self.cache_size -= len(old)
+        self.file_cache[file_path] = data
+        self.cache_size += len(data)
+        
+        # Always keep the newest entry, even if it alone is over budget
+        while self.cache_size > self.max_cache_size and len(self.file_cache) > 1:
+            evicted_path, evicted = self.file_cache.popitem(last=False)
+            self.cache_size -= len(evicted)
+            self.text_cache.pop(evicted_path, None)
+
+    def _cache_text(self, file_path, content):
+        """Keep decoded text for the most recently read files only"""
+        self.text_cache[file_path] = content
+        self.text_cache.move_to_end(file_path)
+        while len(self.text_cache) > MAX_TEXT_ENTRIES:
+            self.text_cache.popitem(last=False)
+
+    def _remember(self, file_path, data, st):
+        """Record the stat and hash of bytes just read from or written to disk"""
+        self.file_meta[file_path] = (st.st_mtime_ns, st.st_size, self.calculate_hash(data))
+
     def calculate_hash(self, content):
-        """Calculate content hash"""
-        return hashlib.md5(content.encode()).hexdigest()
+        """Calculate content hash of bytes (str is encoded as UTF-8 first)"""
+        return content_hash(content)
 
     def has_changed(self, file_path):
         """Check if file has changed"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
-                current_hash = self.calculate_hash(current_content)
-                return self.file_hashes.get(file_path) != current_hash
+            meta = self.file_meta.get(file_path)
+            if meta is None:
+                return True
+            
+            # Unchanged size and mtime: no need to read the file at all
+            st = os.stat(file_path)
+            if meta[:2] == (st.st_mtime_ns, st.st_size):
+                return False
+            
+            # Hash straight from disk without holding the whole file
+            current_hash = file_hash(file_path)
+            if current_hash != meta[2]:
+                return True
+            
+            # Touched but identical; trust the new stat from now on
+            self.file_meta[file_path] = (st.st_mtime_ns, st.st_size, current_hash)
+            return False
         except:
             return True
 
-    def find_files(self, directory, extensions=None):
+    def find_files(self, directory, extensions=None, ignore=None):
         """Find files with specific extensions"""
-        files = []
-        for root, dirs, filenames in os.walk(directory):
-            for filename in filenames:
-                if extensions:
-                    if any(filename.endswith(ext) for ext in extensions):
-                        files.append(os.path.join(root, filename))
-                else:
-                    files.append(os.path.join(root, filename))
-        return files
+        return list(self.iter_files(directory, extensions, ignore))
+
+    def iter_files(self, directory, extensions=None, ignore=None):
+        """
+        Lazily yield files under directory, optionally filtered by extension
+        
+        Args:
+            directory: Root of the search
+            extensions: Optional iterable of suffixes such as ".py"
+            ignore: Directory names to skip (defaults to IGNORED_DIRS);
+                anything matched by the root's .gitignore is skipped too
+        """
+        # str.endswith takes a tuple, checking every extension in one call
+        ext_tuple = tuple(extensions) if extensions else None
+        ignore = IGNORED_DIRS if ignore is None else frozenset(ignore)
+        # Parsed once and shared by the whole recursion
+        gitignore = load_gitignore(directory)
+        prefix_len = len(os.path.join(directory, ''))
+        yield from self._scan(directory, ext_tuple, ignore, gitignore, prefix_len)
+
+    def _scan(self, directory, ext_tuple, ignore, gitignore, prefix_len):
+        """Recursive os.scandir walk behind iter_files"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    if is_dir and (entry.name in ignore or entry.is_symlink()):
+                        # Like os.walk, don't follow directory symlinks
+                        continue
+                    if not is_dir and ext_tuple is not None and not entry.name.endswith(ext_tuple):
+                        continue
+                    if gitignore and gitignore(entry.path[prefix_len:].replace(os.sep, '/'), is_dir):
+                        continue
+                    
+                    if is_dir:
+                        yield from self._scan(entry.path, ext_tuple, ignore, gitignore, prefix_len)
+                    else:
+                        yield entry.path
+        except OSError:
+            pass
 
     def create_project_structure(self, base_path, structure):
         """Create project directory structure"""
+        new_files = {}
+        base = os.path.join(base_path, "")
         for item in structure:
+            try:
+                path = project_file_path(base, item)
+            except ValueError:
+                continue
             if item.endswith('/'):
                 # It's a directory
-                os.makedirs(os.path.join(base_path, item), exist_ok=True)
-            else:
-                # It's a file
-                file_path = os.path.join(base_path, item)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                if not os.path.exists(file_path):
-                    with open(file_path, 'w') as f:
-                        f.write('')
\ No newline at end of file
+                os.makedirs(path, exist_ok=True)
+            elif not os.path.exists(path):
+                # It's a new file
+                new_files[path] = ''
+        
+        # Create the empty files in one batch
+        write_files_bulk(new_files)
\ No newline at end of file
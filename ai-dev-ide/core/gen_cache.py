@@ -0,0 +1,68 @@
+"""
+Generation Cache - Skip LLM calls whose inputs haven't changed
+"""
+import os
+import json
+import hashlib
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Per-project directory for IDE bookkeeping
+CACHE_DIR = ".ai-dev-ide"
+
+# Read size when hashing a file incrementally
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _new_hasher():
+    """Incremental hasher matching content_hash"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+def content_hash(data):
+    """Fast, non-cryptographic hash of str or any bytes-like object as a hex string"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    # Hash the caller's buffer in place rather than copying it
+    hasher = _new_hasher()
+    hasher.update(memoryview(data))
+    return hasher.hexdigest()
+
+def file_hash(path):
+    """content_hash of a file's bytes, read through one reusable buffer"""
+    hasher = _new_hasher()
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+def cache_path(project_path, name):
+    """Location of a named generation cache inside the project"""
+    return os.path.join(project_path, CACHE_DIR, f"{name}.json")
+
+def load_gen_cache(project_path, name):
+    """Load a generation cache, returning an empty dict if missing or corrupt"""
+    try:
+        with open(cache_path(project_path, name), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_gen_cache(project_path, name, cache):
+    """Persist a generation cache atomically"""
+    path = cache_path(project_path, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
\ No newline at end of file
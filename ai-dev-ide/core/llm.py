@@ -4,7 +4,166 @@ LLM Interface - Unified interface for multiple AI providers
 import requests
 import json
 import time
+import os
+import hashlib
+import sqlite3
+import atexit
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from core import fast_json
+from core.thread_pool import DaemonThreadPoolExecutor
 
+# Upper bound on LLM requests an agent keeps in flight at once
+MAX_CONCURRENT_CALLS = 4
+
+# Keep-alive connections pooled per host; enough for several agents at once
+HTTP_POOL_SIZE = 4 * MAX_CONCURRENT_CALLS
+
+# Transient gateway errors and failed connects are retried by the
+# connection pool itself. Generation requests are POSTs and not
+# idempotent, so they are never resent after a read error or timeout
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (502, 503, 504)
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Hugging Face inference endpoint
+HF_INFERENCE_URL = "https://router.huggingface.co/hf-inference"
+
+# Hugging Face answers 503 while a model cold-starts and 429 when rate
+# limited; both are retried by call_huggingface alone, honouring
+# Retry-After up to a cap
+HF_ATTEMPTS = 3
+HF_RETRY_STATUSES = (429, 503)
+HF_MAX_RETRY_DELAY = 30
+
+# Exact-match response cache shared by every agent
+LLM_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ai_dev_ide_llm_cache.sqlite3")
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Recent responses also kept in memory so hot prompts skip SQLite
+MEMORY_CACHE_SIZE = 512
+MEMORY_CACHE_TTL = 30 * 60
+
+_MEMORY_CACHE = OrderedDict()  # key -> (stored_at, response)
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+# Providers report failures as plain text; these must never be cached
+ERROR_PREFIXES = (
+    "Ollama API error",
+    "Ollama connection error",
+    "Hugging Face API error",
+    "Hugging Face connection error",
+    "Hugging Face token required",
+)
+
+def is_error_response(response):
+    """Check if a provider returned an error message instead of output"""
+    return not response or response.startswith(ERROR_PREFIXES)
+
+def _cache_key(api_provider, api_url, model, prompt):
+    """Build a stable key for a (provider, url, model, prompt) request"""
+    payload = json.dumps(
+        {"provider": api_provider, "url": api_url, "model": model, "prompt": prompt},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _open_cache():
+    """Open the cache database, creating the table on first use"""
+    conn = sqlite3.connect(LLM_CACHE_PATH, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+    )
+    return conn
+
+def _memory_get(key):
+    """Return a fresh in-memory response for key, or None"""
+    with _MEMORY_CACHE_LOCK:
+        entry = _MEMORY_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= MEMORY_CACHE_TTL:
+            del _MEMORY_CACHE[key]
+            return None
+        _MEMORY_CACHE.move_to_end(key)
+        return entry[1]
+
+def _memory_put(key, response):
+    """Remember a response in memory, evicting the least recently used"""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[key] = (time.time(), response)
+        _MEMORY_CACHE.move_to_end(key)
+        while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+def _cache_get(key):
+    """Return a fresh cached response for key, or None"""
+    response = _memory_get(key)
+    if response is not None:
+        return response
+    
+    try:
+        with closing(_open_cache()) as conn:
+            row = conn.execute(
+                "SELECT response FROM cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - LLM_CACHE_TTL)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if not row:
+        return None
+    _memory_put(key, row[0])
+    return row[0]
+
+def _cache_put(key, response):
+    """Store a successful response under key"""
+    if is_error_response(response):
+        return
+    _memory_put(key, response)
+    try:
+        with closing(_open_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+    except sqlite3.Error:
+        pass
+
+def clear_llm_cache():
+    """Drop every cached response, in memory and on disk"""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+    try:
+        with closing(_open_cache()) as conn, conn:
+            conn.execute("DELETE FROM cache")
+    except sqlite3.Error:
+        pass
+
+def cached_llm(func):
+    """Serve repeated prompts from the on-disk cache; pass use_cache=False to bypass"""
+    @functools.wraps(func)
+    def wrapper(prompt, api_url, model, api_provider="ollama", use_cache=True, **kwargs):
+        if not use_cache:
+            return func(prompt, api_url, model, api_provider=api_provider, **kwargs)
+        
+        key = _cache_key(api_provider, api_url, model, prompt)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = func(prompt, api_url, model, api_provider=api_provider, **kwargs)
+        _cache_put(key, response)
+        return response
+    return wrapper
+
+@cached_llm
 def call_llm(prompt, api_url, model, api_provider="ollama", **kwargs):
     """
     Call LLM with unified interface
@@ -23,31 +182,123 @@ def call_llm(prompt, api_url, model, api_provider="ollama", **kwargs):
     else:
         raise ValueError(f"Unsupported provider: {api_provider}")
 
+def call_llm_stream(prompt, api_url, model, api_provider="ollama", use_cache=True, **kwargs):
+    """
+    Call LLM and yield the response in chunks as they arrive
+    
+    Takes the same arguments as call_llm. Providers without streaming
+    support yield their whole response as a single chunk.
+    """
+    if api_provider not in ("ollama", "huggingface"):
+        raise ValueError(f"Unsupported provider: {api_provider}")
+    
+    key = _cache_key(api_provider, api_url, model, prompt)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+    
+    if api_provider == "ollama":
+        chunks = stream_ollama(prompt, api_url, model)
+    else:
+        chunks = iter([call_huggingface(prompt, api_url, model, **kwargs)])
+    
+    parts = []
+    failed = False
+    for chunk in chunks:
+        parts.append(chunk)
+        failed = failed or is_error_response(chunk)
+        yield chunk
+    
+    # A stream that broke off midway ends with an error chunk
+    if use_cache and not failed:
+        _cache_put(key, "".join(parts))
+
+def call_llm_batch(prompts, api_url, model, api_provider="ollama", **kwargs):
+    """
+    Send several independent prompts at once
+    
+    Args:
+        prompts: List of prompts
+        api_url: API endpoint URL
+        model: Model name
+        api_provider: Provider type (ollama, huggingface, etc.)
+        **kwargs: Passed through to call_llm
+    
+    Returns:
+        List of responses in the same order as prompts
+    """
+    if not prompts:
+        return []
+    
+    with DaemonThreadPoolExecutor(max_workers=min(len(prompts), MAX_CONCURRENT_CALLS)) as executor:
+        return list(executor.map(
+            lambda prompt: call_llm(prompt, api_url, model, api_provider=api_provider, **kwargs),
+            prompts
+        ))
+
+def get_session():
+    """Shared HTTP session, so LLM calls reuse pooled keep-alive connections"""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.headers.update({"Content-Type": "application/json"})
+                retry = Retry(
+                    total=HTTP_RETRIES,
+                    connect=HTTP_RETRIES,
+                    read=0,
+                    other=0,
+                    status=HTTP_RETRIES,
+                    backoff_factor=HTTP_RETRY_BACKOFF,
+                    status_forcelist=HTTP_RETRY_STATUSES,
+                    # POST only added so the statuses above are retried;
+                    # read=0 keeps it from being resent on a timeout
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                
+                # Hugging Face statuses are retried in call_huggingface; the
+                # pool only retries failed connects there, so one layer owns it
+                hf_retry = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=0, other=0, status=0,
+                                 backoff_factor=HTTP_RETRY_BACKOFF, raise_on_status=False)
+                hf_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=hf_retry)
+                session.mount(HF_INFERENCE_URL, hf_adapter)
+                atexit.register(session.close)
+                _SESSION = session
+    return _SESSION
+
+# Sampling options sent with every Ollama request; shared, never modified
+_OLLAMA_OPTIONS = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "top_k": 40,
+    "repeat_penalty": 1.1,
+    "num_predict": 4000
+}
+
+def _ollama_payload(prompt, model, stream):
+    """Build an Ollama generate request body"""
+    return {"model": model, "prompt": prompt, "stream": stream, "options": _OLLAMA_OPTIONS}
+
 def call_ollama(prompt, api_url, model):
     """Call Ollama API"""
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "options": {
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "top_k": 40,
-            "repeat_penalty": 1.1,
-            "num_predict": 4000
-        }
-    }
+    payload = _ollama_payload(prompt, model, stream=False)
     
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
+            data=fast_json.dumpb(payload),
             timeout=120
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = fast_json.loads(response.content)
             return result.get("response", "")
         else:
             return f"Ollama API error {response.status_code}: {response.text}"
@@ -55,18 +306,48 @@ def call_ollama(prompt, api_url, model):
     except Exception as e:
         return f"Ollama connection error: {str(e)}"
 
+def stream_ollama(prompt, api_url, model):
+    """Call Ollama API in streaming mode, yielding response text chunks"""
+    payload = _ollama_payload(prompt, model, stream=True)
+    
+    try:
+        with get_session().post(
+            api_url,
+            data=fast_json.dumpb(payload),
+            timeout=120,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                yield f"Ollama API error {response.status_code}: {response.text}"
+                return
+            
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = fast_json.loads(line)
+                chunk = data.get("response", "")
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    break
+                    
+    except Exception as e:
+        yield f"Ollama connection error: {str(e)}"
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying: Retry-After if given, else exponential"""
+    try:
+        return min(float(response.headers.get("Retry-After")), HF_MAX_RETRY_DELAY)
+    except (TypeError, ValueError):
+        return 2 ** attempt
+
 def call_huggingface(prompt, api_url, model, token=None):
     """Call Hugging Face Inference API"""
     if not token:
         return "Hugging Face token required"
     
-    # Use router.huggingface.co for inference
-    inference_url = "https://router.huggingface.co/hf-inference"
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = {"Authorization": f"Bearer {token}"}
     
     payload = {
         "inputs": prompt,
@@ -78,16 +359,23 @@ def call_huggingface(prompt, api_url, model, token=None):
         }
     }
     
+    body = fast_json.dumpb(payload)
+    
     try:
-        response = requests.post(
-            f"{inference_url}/{model}",
-            json=payload,
-            headers=headers,
-            timeout=120
-        )
+        for attempt in range(HF_ATTEMPTS):
+            response = get_session().post(
+                f"{HF_INFERENCE_URL}/{model}",
+                data=body,
+                headers=headers,
+                timeout=120
+            )
+            # Error bodies are only read once retries are exhausted
+            if response.status_code not in HF_RETRY_STATUSES or attempt == HF_ATTEMPTS - 1:
+                break
+            time.sleep(_retry_delay(response, attempt))
         
         if response.status_code == 200:
-            result = response.json()
+            result = fast_json.loads(response.content)
             if isinstance(result, list) and len(result) > 0:
                 return result[0].get("generated_text", "")
             return str(result)
@@ -107,10 +395,11 @@ def test_llm_connection(api_provider, api_url, model, token=None):
             api_url,
             model,
             api_provider=api_provider,
+            use_cache=False,
             token=token
         )
         
-        if "Hello" in response or "hello" in response:
+        if "hello" in response.lower():
             return True, response
         else:
             return False, f"Unexpected response: {response[:100]}"
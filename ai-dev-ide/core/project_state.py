@@ -1,25 +1,42 @@
 """
 Project State Management
 """
+import datetime
+from collections import defaultdict, deque
+from core import fast_json
+
+# Most recent errors and warnings kept; older ones are dropped
+MAX_ERRORS = 1000
+
+# Most recent AI suggestions kept per file
+MAX_SUGGESTIONS_PER_FILE = 200
+
 PROJECT_STATE = {
     'plan': {},
+    'plan_json': None,
     'current_file': None,
     'open_files': [],
-    'errors': [],
-    'warnings': [],
-    'ai_suggestions': {}
+    'errors': deque(maxlen=MAX_ERRORS),
+    'warnings': deque(maxlen=MAX_ERRORS),
+    'ai_suggestions': defaultdict(lambda: deque(maxlen=MAX_SUGGESTIONS_PER_FILE))
 }
 
 def update_plan(plan_data):
     """Update project plan"""
     PROJECT_STATE['plan'] = plan_data
+    PROJECT_STATE['plan_json'] = None
 
 def get_plan():
     """Get project plan"""
     return PROJECT_STATE.get('plan', {})
 
+def get_plan_json():
+    """Get the project plan as indented JSON, serialized once per plan"""
+    if PROJECT_STATE.get('plan_json') is None:
+        PROJECT_STATE['plan_json'] = fast_json.dumps(get_plan(), indent=True)
+    return PROJECT_STATE['plan_json']
+
 def add_error(error_msg, file_path=None):
-    import datetime
     """Add error to state"""
     error = {
         'message': error_msg,
@@ -30,14 +47,12 @@ def add_error(error_msg, file_path=None):
 
 def clear_errors():
     """Clear all errors"""
-    PROJECT_STATE['errors'] = []
+    PROJECT_STATE['errors'].clear()
 
 def add_suggestion(file_path, suggestion):
     """Add AI suggestion"""
-    if file_path not in PROJECT_STATE['ai_suggestions']:
-        PROJECT_STATE['ai_suggestions'][file_path] = []
     PROJECT_STATE['ai_suggestions'][file_path].append(suggestion)
 
 def clear_suggestions():
     """Clear all suggestions"""
-    PROJECT_STATE['ai_suggestions'] = {}
\ No newline at end of file
+    PROJECT_STATE['ai_suggestions'].clear()
\ No newline at end of file
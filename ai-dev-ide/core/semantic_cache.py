@@ -0,0 +1,236 @@
+"""
+Semantic Cache - Reuse LLM responses for near-duplicate requests
+"""
+import os
+import math
+import importlib.util
+import atexit
+import pickle
+import functools
+import threading
+from collections import Counter
+from core.llm import call_llm, call_llm_batch, call_llm_stream, is_error_response
+
+# sentence-transformers pulls in torch, so it is only imported when the
+# first embedding is needed rather than when the IDE starts
+try:
+    import numpy as np
+    EMBEDDINGS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+# Cosine similarity above which two requests count as the same, for
+# sentence embeddings
+SIMILARITY_THRESHOLD = 0.92
+
+# Character n-grams score unrelated requests that share wording highly,
+# so without the model only near-verbatim repeats are matched
+NGRAM_SIMILARITY_THRESHOLD = 0.98
+
+# Entries kept per namespace before the oldest are dropped
+MAX_ENTRIES = 256
+
+# Sentence embedding model, used when sentence-transformers is installed
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Directory the cache is saved to between sessions
+SEMANTIC_CACHE_DIR = os.path.expanduser("~")
+
+def embed(text, n=3):
+    """Embed text as an L2-normalized bag of character n-grams"""
+    text = " ".join(text.lower().split())
+    grams = Counter(text[i:i + n] for i in range(max(len(text) - n + 1, 1)))
+    norm = math.sqrt(sum(count * count for count in grams.values())) or 1.0
+    return {gram: count / norm for gram, count in grams.items()}
+
+def cosine_similarity(a, b):
+    """Cosine similarity of two normalized sparse vectors"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+@functools.lru_cache(maxsize=None)
+def _get_model():
+    """Load the sentence embedding model once; None when it can't be used"""
+    if not EMBEDDINGS_AVAILABLE:
+        return None
+    try:
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception:
+        return None
+
+def embeddings_loaded():
+    """Whether similarity comes from the sentence model, not n-grams"""
+    return _get_model() is not None
+
+def backend_name():
+    """Name of the embedding in use; vectors from different ones don't mix"""
+    if _get_model() is None:
+        return "ngram"
+    return EMBEDDING_MODEL.rsplit("/", 1)[-1]
+
+def vectorize(text):
+    """Unit vector for text: a float32 array with the model, else n-grams"""
+    model = _get_model()
+    if model is None:
+        return embed(text)
+    return model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+class SemanticCache:
+    def __init__(self, threshold=SIMILARITY_THRESHOLD, max_entries=MAX_ENTRIES, cache_dir=None,
+                 ngram_threshold=NGRAM_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.ngram_threshold = ngram_threshold
+        self.max_entries = max_entries
+        # namespace -> (vectors, responses); vectors is an (N, dim) array
+        # with the embedding model, or a list of sparse n-gram vectors
+        self.entries = {}
+        self.cache_dir = cache_dir
+        self.loaded = cache_dir is None
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def _path(self):
+        return os.path.join(self.cache_dir, f".ai_dev_ide_semantic_{backend_name()}.pkl")
+
+    def _load(self):
+        """Read the saved entries on first use; caller holds the lock"""
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(self._path(), "rb") as f:
+                saved = pickle.load(f)
+        except Exception:
+            return
+        if isinstance(saved, dict):
+            self.entries.update(saved)
+
+    def get(self, namespace, text):
+        """Return the closest cached response above the threshold, or None"""
+        vector = vectorize(text)
+        with self.lock:
+            self._load()
+            if namespace not in self.entries:
+                return None
+            vectors, responses = self.entries[namespace]
+            if isinstance(vectors, list):
+                scores = [cosine_similarity(vector, cached) for cached in vectors]
+                best = max(range(len(scores)), key=scores.__getitem__)
+                threshold = self.ngram_threshold
+            else:
+                # One matrix-vector product scores every entry
+                scores = vectors @ vector
+                best = int(scores.argmax())
+                threshold = self.threshold
+            if scores[best] >= threshold:
+                return responses[best]
+        return None
+
+    def put(self, namespace, text, response):
+        """Store a response for later near-duplicate lookups"""
+        vector = vectorize(text)
+        with self.lock:
+            self._load()
+            if namespace in self.entries:
+                vectors, responses = self.entries[namespace]
+            else:
+                vectors, responses = [], []
+            if isinstance(vector, dict):
+                vectors = vectors + [vector]
+            elif len(vectors):
+                vectors = np.vstack([vectors, vector])
+            else:
+                vectors = vector[np.newaxis, :]
+            self.entries[namespace] = (vectors[-self.max_entries:], (responses + [response])[-self.max_entries:])
+            self.dirty = True
+
+    def save(self):
+        """Write the entries to disk if anything changed"""
+        with self.lock:
+            if not self.dirty or self.cache_dir is None:
+                return
+            path = self._path()
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+                self.dirty = False
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self.lock:
+            self.entries.clear()
+            self.loaded = True
+            self.dirty = True
+
+SEMANTIC_CACHE = SemanticCache(cache_dir=SEMANTIC_CACHE_DIR)
+atexit.register(SEMANTIC_CACHE.save)
+
+def call_llm_semantic(prompt, api_url, model, namespace, key_text, **kwargs):
+    """
+    Call LLM unless a near-identical request was already answered
+
+    Args:
+        prompt: The full prompt to send on a miss
+        api_url: API endpoint URL
+        model: Model name
+        namespace: Exact-match scope (template name, file name, ...)
+        key_text: The variable part of the prompt used for similarity
+        **kwargs: Passed through to call_llm
+    """
+    scope = (namespace, model)
+    cached = SEMANTIC_CACHE.get(scope, key_text)
+    if cached is not None:
+        return cached
+
+    response = call_llm(prompt, api_url, model, **kwargs)
+    if not is_error_response(response):
+        SEMANTIC_CACHE.put(scope, key_text, response)
+    return response
+
+def call_llm_semantic_batch(requests, api_url, model, **kwargs):
+    """
+    Batch counterpart of call_llm_semantic
+
+    Args:
+        requests: List of (prompt, namespace, key_text) tuples
+        api_url: API endpoint URL
+        model: Model name
+        **kwargs: Passed through to call_llm_batch
+
+    Returns:
+        List of responses in the same order as requests
+    """
+    responses = [SEMANTIC_CACHE.get((namespace, model), key_text) for _, namespace, key_text in requests]
+    misses = [i for i, response in enumerate(responses) if response is None]
+
+    fresh = call_llm_batch([requests[i][0] for i in misses], api_url, model, **kwargs)
+    for i, response in zip(misses, fresh):
+        responses[i] = response
+        if not is_error_response(response):
+            _, namespace, key_text = requests[i]
+            SEMANTIC_CACHE.put((namespace, model), key_text, response)
+    return responses
+
+def stream_llm_semantic(prompt, api_url, model, namespace, key_text, **kwargs):
+    """Streaming counterpart of call_llm_semantic; yields response chunks"""
+    scope = (namespace, model)
+    cached = SEMANTIC_CACHE.get(scope, key_text)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    failed = False
+    for chunk in call_llm_stream(prompt, api_url, model, **kwargs):
+        parts.append(chunk)
+        failed = failed or is_error_response(chunk)
+        yield chunk
+
+    if not failed:
+        SEMANTIC_CACHE.put(scope, key_text, "".join(parts))
@@ -0,0 +1,75 @@
+"""
+Thread Pool - An executor whose workers don't keep the process alive
+"""
+import queue
+import threading
+from concurrent.futures import Executor, Future
+
+class DaemonThreadPoolExecutor(Executor):
+    """
+    ThreadPoolExecutor counterpart built on daemon threads
+
+    concurrent.futures joins its own workers at interpreter exit, so a
+    pending LLM call would hold the process open after the window has
+    closed. These workers are daemons and simply stop with the process.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="worker"):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads = []
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._work_queue.put((future, fn, args, kwargs))
+            # Start another worker unless one is waiting for work
+            if not self._idle.acquire(timeout=0) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            return future
+
+    def _worker(self):
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future
+            self._idle.release()
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._work_queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
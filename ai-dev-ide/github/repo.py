@@ -2,36 +2,49 @@
 GitHub Repository Operations
 """
 import os
+import functools
 from github import Github
 from github import Auth
 
+# Repositories fetched per page when listing
+PER_PAGE = 100
+
+@functools.lru_cache(maxsize=8)
+def _client(token):
+    """Authenticated client and user for a token, reused across calls"""
+    g = Github(auth=Auth.Token(token), per_page=PER_PAGE)
+    return g, g.get_user()
+
 def create_github_repo(token, repo_name, description="", private=False):
     """Create a new GitHub repository"""
     try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
-        user = g.get_user()
+        g, user = _client(token)
         repo = user.create_repo(repo_name, description=description, private=private)
         return repo.clone_url
     except Exception as e:
         raise Exception(f"Failed to create repo: {e}")
 
+def iter_user_repo_names(token):
+    """
+    Yield the names of the user's repositories page by page
+    
+    The client's per_page makes each page request fetch PER_PAGE entries.
+    """
+    g, user = _client(token)
+    for repo in user.get_repos():
+        yield repo.name
+
 def get_user_repos(token):
     """Get user's repositories"""
     try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
-        user = g.get_user()
-        return [repo.name for repo in user.get_repos()]
+        return list(iter_user_repo_names(token))
     except Exception as e:
         return []
 
 def delete_github_repo(token, repo_name):
     """Delete a GitHub repository"""
     try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
-        user = g.get_user()
+        g, user = _client(token)
         repo = user.get_repo(repo_name)
         repo.delete()
         return True
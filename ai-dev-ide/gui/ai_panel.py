@@ -4,11 +4,39 @@ AI Panel Module
 import tkinter as tk
 from tkinter import ttk
 import threading
+from core.llm import call_llm_stream
+from core.semantic_cache import stream_llm_semantic, embeddings_loaded
+
+# Chat text is redrawn at most once per this many milliseconds (~30 Hz)
+CHAT_FLUSH_MS = 33
+
+# Once the chat passes CHAT_MAX_LINES it is cut back to CHAT_KEEP_LINES;
+# the line count is checked every CHAT_TRIM_INTERVAL redraws
+CHAT_MAX_LINES = 6000
+CHAT_KEEP_LINES = 5000
+CHAT_TRIM_INTERVAL = 100
+
+# Characters of each suggested file shown in the changes preview
+PREVIEW_CHARS = 500
+
+CHANGES_SEPARATOR = "-" * 40
+
+def _format_change(filename, content):
+    preview = content[:PREVIEW_CHARS] + ("..." if len(content) > PREVIEW_CHARS else "")
+    return f"File: {filename}\n{CHANGES_SEPARATOR}\n{preview}\n\n"
 
 class AIPanel(ttk.Frame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
+        # LLM helpers bound once; chat uses one or the other per message
+        self._stream_llm = call_llm_stream
+        self._stream_llm_semantic = stream_llm_semantic
+        # Text waiting for the next chat redraw; appended from any thread
+        self._pending = []
+        self._flush_scheduled = False
+        self._pending_lock = threading.Lock()
+        self._flush_count = 0
         self.setup_panel()
 
     def setup_panel(self):
@@ -62,16 +90,15 @@ class AIPanel(ttk.Frame):
         self.chat_input.delete(0, "end")
         self.add_chat_message("User", message)
         
-        # Process in background
-        threading.Thread(target=self.process_ai_response, args=(message,), daemon=True).start()
+        # Process on the app's pool for UI requests
+        self.app.run_in_background(self.process_ai_response, message)
 
     def process_ai_response(self, message):
         """Process AI response"""
-        self.app.update_progress("AI thinking...", True)
+        self.app.ai_busy.set()
         
         try:
             # Use LLM to generate response
-            from core.llm import call_llm
             api_url = self.app.settings.get("api_url", "")
             model = self.app.settings.get("model", "")
             
@@ -81,17 +108,56 @@ Current project: {self.app.project_path if self.app.project_path else 'No projec
             
 Provide helpful, concise response about coding, project structure, or debugging."""
             
-            response = call_llm(prompt, api_url, model)
-            self.add_chat_message("AI", response)
+            # With the sentence model, paraphrases of an earlier question
+            # in the same project get its answer; n-gram similarity is too
+            # loose for chat, so only exact repeats are reused without it.
+            # Fresh answers are shown token by token as they are written
+            if embeddings_loaded():
+                namespace = ("chat", self.app.project_path)
+                chunks = self._stream_llm_semantic(prompt, api_url, model, namespace=namespace, key_text=message)
+            else:
+                chunks = self._stream_llm(prompt, api_url, model)
+            self.append_chat_text("\nAI: ")
+            for chunk in chunks:
+                self.append_chat_text(chunk)
+            self.append_chat_text("\n")
             
         except Exception as e:
             self.add_chat_message("AI", f"Error: {str(e)}")
         finally:
-            self.app.clear_progress()
+            self.app.ai_busy.clear()
 
     def add_chat_message(self, sender, message):
         """Add message to chat"""
-        self.chat_text.insert("end", f"\n{sender}: {message}\n")
+        self.append_chat_text(f"\n{sender}: {message}\n")
+
+    def append_chat_text(self, text):
+        """
+        Append raw text, such as a streamed chunk, to the chat
+        
+        Safe to call from worker threads. Text is buffered and written
+        with a single insert and scroll on the next scheduled redraw.
+        """
+        with self._pending_lock:
+            self._pending.append(text)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self.chat_text.after(CHAT_FLUSH_MS, self._flush_chat)
+
+    def _flush_chat(self):
+        with self._pending_lock:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        self.chat_text.insert("end", text)
+        
+        self._flush_count += 1
+        if self._flush_count >= CHAT_TRIM_INTERVAL:
+            self._flush_count = 0
+            line_count = int(self.chat_text.index("end-1c").split(".")[0])
+            if line_count > CHAT_MAX_LINES:
+                self.chat_text.delete("1.0", f"end-{CHAT_KEEP_LINES}l")
         self.chat_text.see("end")
 
     def display_suggested_changes(self, changes):
@@ -99,15 +165,16 @@ Provide helpful, concise response about coding, project structure, or debugging.
         self.changes_text.delete("1.0", "end")
         
         if isinstance(changes, dict):
-            for filename, content in changes.items():
-                self.changes_text.insert("end", f"File: {filename}\n")
-                self.changes_text.insert("end", "-" * 40 + "\n")
-                # Show preview (first 500 chars)
-                preview = content[:500] + ("..." if len(content) > 500 else "")
-                self.changes_text.insert("end", preview + "\n\n")
+            # Build the whole listing and insert it in one call
+            parts = [_format_change(filename, content) for filename, content in changes.items()]
+            self.changes_text.insert("end", "".join(parts))
         else:
             self.changes_text.insert("end", str(changes))
 
+    def add_suggested_change(self, filename, content):
+        """Append one suggested change to those already displayed"""
+        self.changes_text.insert("end", _format_change(filename, content))
+
     def clear_suggestions(self):
         """Clear suggestions"""
         self.changes_text.delete("1.0", "end")
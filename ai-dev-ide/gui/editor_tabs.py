@@ -3,17 +3,84 @@ Editor Tabs Module
 """
 import os
 import re
+import shutil
+import tempfile
 import tkinter as tk
 from tkinter import ttk
 from tkinter import font as tkfont
 import threading
 
+# Keywords the highlighter colours
+_PY_KEYWORDS = frozenset((
+    'def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 'import', 'from',
+    'return', 'pass', 'break', 'continue', 'with', 'as', 'True', 'False', 'None', 'and', 'or',
+    'not', 'in', 'is',
+))
+
+# Highlighting tokenizer, compiled once for every file opened. A single
+# left-to-right scan classifies each token by its group name, so a '#'
+# inside a string is not taken for a comment and vice versa. Alternation
+# takes the first branch that matches, so longer keywords come first.
+# Keywords are ASCII, so re.ASCII lets \b skip Unicode word lookups
+_PY_TOKEN_RE = re.compile(
+    r'(?P<comment>#[^\n]*)'
+    r'|(?P<string>"(?:[^"\\\n]|\\.)*"' r"|'(?:[^'\\\n]|\\.)*')"
+    r'|(?P<keyword>\b(?:' + '|'.join(sorted(_PY_KEYWORDS, key=lambda k: (-len(k), k))) + r')\b)',
+    re.ASCII
+)
+
+# Characters shown as soon as a file opens; the rest streams in behind
+LOAD_HEAD_CHARS = 64 * 1024
+LOAD_CHUNK_CHARS = 256 * 1024
+
+# Lines copied out of the buffer per write when saving
+SAVE_CHUNK_LINES = 1000
+
+# Tags the highlighter manages, and tokens tagged per event loop turn
+HIGHLIGHT_TAGS = ("keyword", "string", "comment")
+HIGHLIGHT_BATCH = 500
+
+# Files longer than this only have their visible lines highlighted
+HIGHLIGHT_MAX_CHARS = 256_000
+
+def _scan(content, first_line=1):
+    """
+    Tokenize Python source into (tag, start, end) Tk "line.col" indices
+    
+    content starts at column 0 of first_line. No token spans a newline,
+    so both ends of a token share its line.
+    """
+    tokens = []
+    line = first_line
+    line_start = 0
+    position = 0
+    for match in _PY_TOKEN_RE.finditer(content):
+        start = match.start()
+        # Count the newlines since the previous token: linear overall
+        newlines = content.count("\n", position, start)
+        if newlines:
+            line += newlines
+            line_start = content.rindex("\n", position, start) + 1
+        position = start
+        tokens.append((match.lastgroup, f"{line}.{start - line_start}", f"{line}.{match.end() - line_start}"))
+    return tokens
+
+def _line_count(text_widget):
+    """Number of lines in a text widget"""
+    return int(text_widget.index("end-1c").split(".")[0])
+
 class EditorTabs(ttk.Frame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
         self.current_file = None
         self.open_files = {}  # filename -> (tab_id, text_widget)
+        self._tab_to_file = {}  # tab_id -> filename
+        self._highlight_jobs = {}  # text_widget -> latest highlight job
+        self._line_counts = {}  # text_widget -> line count when last tagged
+        self._loading = {}  # text_widget -> load job still streaming content in
+        self._viewport_only = set()  # large files highlighted as they scroll
+        self._viewport_pending = set()  # viewport highlights already scheduled
         self.setup_notebook()
 
     def setup_notebook(self):
@@ -34,14 +101,12 @@ class EditorTabs(ttk.Frame):
     def open_file(self, file_path):
         """Open a file in new tab"""
         # Check if already open
-        for filename, (tab_id, _) in self.open_files.items():
-            if filename == file_path:
-                self.notebook.select(tab_id)
-                return
+        if file_path in self.open_files:
+            self.notebook.select(self.open_files[file_path][0])
+            return
         
-        # Create new tab
+        # Create new tab; the notebook lays it out once it is added
         frame = ttk.Frame(self.notebook)
-        frame.pack(fill="both", expand=True)
         
         # Text widget with scrollbars
         text_frame = ttk.Frame(frame)
@@ -54,41 +119,95 @@ class EditorTabs(ttk.Frame):
         x_scrollbar = ttk.Scrollbar(text_frame, orient="horizontal")
         x_scrollbar.pack(side="bottom", fill="x")
         
-        # Text widget
+        # Text widget; its colours come from the option database entries
+        # set in apply_theme, which match it by name
         text_widget = tk.Text(text_frame, 
+                             name="editor",
                              wrap="none",
                              undo=True,
-                             yscrollcommand=y_scrollbar.set,
                              xscrollcommand=x_scrollbar.set,
                              font=(self.app.theme["FONT_FAMILY"], self.app.theme["FONT_SIZE"]))
         text_widget.pack(side="left", fill="both", expand=True)
         
         y_scrollbar.config(command=text_widget.yview)
+        text_widget.configure(
+            yscrollcommand=lambda first, last: self._on_yscroll(text_widget, y_scrollbar, first, last)
+        )
         x_scrollbar.config(command=text_widget.xview)
         
-        # Load file content
+        # Load the first screenfuls now and the rest of a large file in the
+        # background; undo is off meanwhile so the load isn't recorded
+        f = None
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                text_widget.insert("1.0", content)
+            f = open(file_path, 'r', encoding='utf-8')
+            head = f.read(LOAD_HEAD_CHARS)
+            text_widget.insert("1.0", head)
+            if len(head) < LOAD_HEAD_CHARS:
+                f.close()
+                f = None
         except Exception as e:
+            if f is not None:
+                f.close()
+                f = None
             text_widget.insert("1.0", f"# Error reading file: {e}")
         
-        # Apply basic theme colors immediately
-        text_widget.configure(
-            bg=self.app.theme["EDITOR_BG"],
-            fg=self.app.theme["FG"],
-            insertbackground=self.app.theme["CURSOR"],
-            selectbackground=self.app.theme["TREE_SELECT"]
-        )
-        
-        # Add to notebook
-        tab_id = self.notebook.add(frame, text=os.path.basename(file_path))
+        # Add to notebook; a tab's id is its frame's widget path, which is
+        # what notebook.select() reports
+        self.notebook.add(frame, text=os.path.basename(file_path))
+        tab_id = str(frame)
         self.open_files[file_path] = (tab_id, text_widget)
+        self._tab_to_file[tab_id] = file_path
         self.notebook.select(tab_id)
         
-        # Apply syntax highlighting
+        if f is None:
+            self._finish_loading(file_path, text_widget)
+        else:
+            job = object()
+            self._loading[text_widget] = job
+            text_widget.configure(undo=False)
+            threading.Thread(
+                target=self._load_worker, args=(file_path, text_widget, f, job), daemon=True
+            ).start()
+
+    def _load_worker(self, file_path, text_widget, f, job):
+        """Read the rest of an open file, handing chunks to the UI thread"""
+        error = None
+        try:
+            with f:
+                for chunk in iter(lambda: f.read(LOAD_CHUNK_CHARS), ""):
+                    # Stop once the tab is closed or its content replaced
+                    if self._loading.get(text_widget) is not job:
+                        return
+                    text_widget.after(0, self._insert_chunk, text_widget, chunk, job)
+        except (RuntimeError, tk.TclError):
+            return  # The widget or the window has been destroyed
+        except Exception as e:
+            error = f"Error reading {file_path}: {e}"
+        try:
+            if error:
+                text_widget.after(0, self.app.log_ai, error)
+            text_widget.after(0, self._finish_loading, file_path, text_widget, job)
+        except (RuntimeError, tk.TclError):
+            pass  # The widget or the window has been destroyed
+
+    def _insert_chunk(self, text_widget, chunk, job):
+        # Chunks queued before a load was cancelled must not be appended
+        if self._loading.get(text_widget) is job:
+            text_widget.insert("end-1c", chunk)
+
+    def _finish_loading(self, file_path, text_widget, job=None):
+        """Enable undo and highlighting once a file's content is all in"""
+        if job is not None and self._loading.get(text_widget) is not job:
+            return
+        self._loading.pop(text_widget, None)
+        text_widget.configure(undo=True)
+        text_widget.edit_reset()
+        
+        # Apply syntax highlighting, then keep it current as lines are edited
         self.apply_basic_syntax_highlighting(file_path, text_widget)
+        if file_path.endswith('.py'):
+            text_widget.edit_modified(False)
+            text_widget.bind("<<Modified>>", self._on_modified)
 
     def apply_basic_syntax_highlighting(self, file_path, text_widget):
         """Apply basic syntax highlighting"""
@@ -98,44 +217,118 @@ class EditorTabs(ttk.Frame):
             text_widget.tag_configure("string", foreground="#6aab73")
             text_widget.tag_configure("comment", foreground="#6a9955")
             text_widget.tag_configure("function", foreground="#dcdcaa")
+            self._line_counts[text_widget] = _line_count(text_widget)
             
-            # Simple keyword matching
-            keywords = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
-                       'import', 'from', 'return', 'pass', 'break', 'continue', 'with', 'as',
-                       'True', 'False', 'None', 'and', 'or', 'not', 'in', 'is']
-            
-            content = text_widget.get("1.0", "end-1c")
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines):
-                # Comments
-                if '#' in line:
-                    comment_start = line.find('#')
-                    text_widget.tag_add("comment", f"{i+1}.{comment_start}", f"{i+1}.end")
-                
-                # Keywords
-                for keyword in keywords:
-                    for match in re.finditer(r'\b' + keyword + r'\b', line):
-                        start = match.start()
-                        end = match.end()
-                        text_widget.tag_add("keyword", f"{i+1}.{start}", f"{i+1}.{end}")
-                
-                # Strings
-                for match in re.finditer(r'["\'](?:[^"\\]|\\.)*["\']', line):
-                    start = match.start()
-                    end = match.end()
-                    text_widget.tag_add("string", f"{i+1}.{start}", f"{i+1}.{end}")
+            # Whole-file tagging of a huge file is too slow to be worth it
+            size = text_widget.count("1.0", "end-1c", "chars")
+            if size and size[0] > HIGHLIGHT_MAX_CHARS:
+                self._viewport_only.add(text_widget)
+                self._highlight_jobs.pop(text_widget, None)
+                self._highlight_viewport(text_widget)
+                return
+            self._viewport_only.discard(text_widget)
+            self._highlight_all(text_widget)
             
             # Could add more sophisticated highlighting here
 
+    def _highlight_all(self, text_widget):
+        """Start a whole-file highlight, superseding any still running"""
+        # Scan off the UI thread; only tagging has to happen on it
+        content = text_widget.get("1.0", "end-1c")
+        job = object()
+        self._highlight_jobs[text_widget] = job
+        threading.Thread(
+            target=self._highlight_worker, args=(text_widget, content, job), daemon=True
+        ).start()
+
+    def _highlight_worker(self, text_widget, content, job):
+        tokens = _scan(content)
+        text_widget.after(0, self._apply_tags, text_widget, tokens, job)
+
+    def _apply_tags(self, text_widget, tokens, job, start=0):
+        """Tag one batch of tokens, then yield to the event loop for the next"""
+        # A newer highlight of this widget supersedes this one
+        if self._highlight_jobs.get(text_widget) is not job or not text_widget.winfo_exists():
+            return
+        if start == 0:
+            for tag in HIGHLIGHT_TAGS:
+                text_widget.tag_remove(tag, "1.0", "end")
+        
+        end = start + HIGHLIGHT_BATCH
+        self._add_tags(text_widget, tokens[start:end])
+        if end < len(tokens):
+            text_widget.after_idle(self._apply_tags, text_widget, tokens, job, end)
+        else:
+            del self._highlight_jobs[text_widget]
+
+    def _add_tags(self, text_widget, tokens):
+        """Tag tokens from _scan; tag_add takes many ranges, so one call per tag"""
+        runs = {}
+        for tag, token_start, token_end in tokens:
+            runs.setdefault(tag, []).extend((token_start, token_end))
+        for tag, indices in runs.items():
+            text_widget.tag_add(tag, *indices)
+
+    def _on_yscroll(self, text_widget, scrollbar, first, last):
+        """Update the scrollbar and queue a viewport highlight for large files"""
+        scrollbar.set(first, last)
+        if text_widget in self._viewport_only and text_widget not in self._viewport_pending:
+            self._viewport_pending.add(text_widget)
+            text_widget.after_idle(self._highlight_viewport, text_widget)
+
+    def _highlight_viewport(self, text_widget):
+        """Highlight only the lines currently on screen"""
+        self._viewport_pending.discard(text_widget)
+        if not text_widget.winfo_exists():
+            return
+        first = text_widget.index("@0,0 linestart")
+        last = text_widget.index(f"@0,{text_widget.winfo_height()} lineend")
+        for tag in HIGHLIGHT_TAGS:
+            text_widget.tag_remove(tag, first, last)
+        self._add_tags(text_widget, _scan(text_widget.get(first, last), int(first.split(".")[0])))
+
+    def _on_modified(self, event):
+        """
+        Re-highlight the lines touched by an edit
+        
+        Edits leave the cursor at the end of inserted text or where a
+        deletion joined two lines, so the edited range ends at the cursor
+        line and starts as many lines above it as the buffer gained. A
+        replaced selection can change lines without changing the count,
+        so the lines on screen are re-tagged along with that range.
+        """
+        text_widget = event.widget
+        # Resetting the flag below fires <<Modified>> again; ignore that
+        if not text_widget.edit_modified():
+            return
+        
+        line_count = _line_count(text_widget)
+        added = line_count - self._line_counts.get(text_widget, line_count)
+        self._line_counts[text_widget] = line_count
+        
+        # Indices in a pass still being applied describe the old text;
+        # rescanning the current text covers this edit as well
+        if text_widget in self._highlight_jobs:
+            self._highlight_all(text_widget)
+            text_widget.edit_modified(False)
+            return
+        
+        insert_line = int(text_widget.index("insert").split(".")[0])
+        first_line = min(insert_line - max(added, 0), int(text_widget.index("@0,0").split(".")[0]))
+        first_line = max(first_line, 1)
+        last_line = max(insert_line, int(text_widget.index(f"@0,{text_widget.winfo_height()}").split(".")[0]))
+        range_start = f"{first_line}.0"
+        range_end = f"{last_line}.end"
+        for tag in HIGHLIGHT_TAGS:
+            text_widget.tag_remove(tag, range_start, range_end)
+        self._add_tags(text_widget, _scan(text_widget.get(range_start, range_end), first_line))
+        text_widget.edit_modified(False)
+
     def on_tab_changed(self, event):
         """Handle tab change"""
         tab_id = self.notebook.select()
-        if tab_id:
-            for filename, (tid, text_widget) in self.open_files.items():
-                if tid == tab_id:
-                    self.current_file = filename
-                    break
+        if tab_id in self._tab_to_file:
+            self.current_file = self._tab_to_file[tab_id]
 
     def show_tab_menu(self, event):
         """Show tab context menu"""
@@ -147,37 +340,56 @@ class EditorTabs(ttk.Frame):
     def close_current_tab(self):
         """Close current tab"""
         tab_id = self.notebook.select()
-        if tab_id:
-            # Find filename for this tab
-            filename_to_remove = None
-            for filename, (tid, _) in self.open_files.items():
-                if tid == tab_id:
-                    filename_to_remove = filename
-                    break
-            
-            if filename_to_remove:
-                del self.open_files[filename_to_remove]
-                self.notebook.forget(tab_id)
+        filename = self._tab_to_file.pop(tab_id, None)
+        if filename:
+            tab_id, text_widget = self.open_files.pop(filename)
+            self._loading.pop(text_widget, None)
+            self.notebook.forget(tab_id)
 
     def save_current_file(self):
         """Save current file"""
-        tab_id = self.notebook.select()
-        if tab_id and self.current_file:
-            for filename, (tid, text_widget) in self.open_files.items():
-                if tid == tab_id:
-                    content = text_widget.get("1.0", "end-1c")
-                    try:
-                        with open(filename, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        self.app.log_ai(f"Saved: {os.path.basename(filename)}")
-                    except Exception as e:
-                        self.app.log_ai(f"Error saving {filename}: {e}")
+        filename = self._tab_to_file.get(self.notebook.select())
+        if filename and self.current_file:
+            tab_id, text_widget = self.open_files[filename]
+            if text_widget in self._loading:
+                self.app.log_ai(f"Still loading {os.path.basename(filename)}; not saved")
+                return
+            try:
+                self.write_buffer(text_widget, filename)
+                self.app.log_ai(f"Saved: {os.path.basename(filename)}")
+            except Exception as e:
+                self.app.log_ai(f"Error saving {filename}: {e}")
+
+    def write_buffer(self, text_widget, filename):
+        """Write a text widget to disk a block of lines at a time, atomically"""
+        last_line = int(text_widget.index("end-1c").split(".")[0])
+        # Replace the file a symlink points to, not the link itself, from a
+        # uniquely named temporary file beside it
+        target = os.path.realpath(filename)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), prefix=os.path.basename(target) + ".", suffix=".tmp"
+        )
+        try:
+            with open(fd, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for line in range(1, last_line + 1, SAVE_CHUNK_LINES):
+                    end = line + SAVE_CHUNK_LINES
+                    f.write(text_widget.get(f"{line}.0", f"{end}.0" if end <= last_line else "end-1c"))
+            # mkstemp creates the file owner-only; keep the original's mode
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def close_all_tabs(self):
         """Close all open tabs"""
         for tab_id in self.notebook.tabs():
             self.notebook.forget(tab_id)
         self.open_files.clear()
+        self._loading.clear()
+        self._tab_to_file.clear()
 
     def get_current_file(self):
         """Get current file path"""
@@ -191,10 +403,11 @@ class EditorTabs(ttk.Frame):
         """Save all open files"""
         saved = []
         for filename, (tab_id, text_widget) in self.open_files.items():
-            content = text_widget.get("1.0", "end-1c")
+            # A partly loaded buffer would truncate the file
+            if text_widget in self._loading:
+                continue
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                self.write_buffer(text_widget, filename)
                 saved.append(filename)
             except Exception as e:
                 self.app.log_ai(f"Error saving {filename}: {e}")
@@ -204,11 +417,28 @@ class EditorTabs(ttk.Frame):
         """Update file content if open"""
         if filename in self.open_files:
             tab_id, text_widget = self.open_files[filename]
+            # Drop the rest of a file still loading behind the new content
+            loading = self._loading.pop(text_widget, None) is not None
             text_widget.delete("1.0", "end")
             text_widget.insert("1.0", new_content)
+            if loading:
+                self._finish_loading(filename, text_widget)
+                return
+            self.apply_basic_syntax_highlighting(filename, text_widget)
+            # The whole buffer is being re-highlighted; don't let the
+            # queued <<Modified>> event cancel that
+            text_widget.edit_modified(False)
 
     def apply_theme(self, theme):
         """Apply theme to editors"""
+        # Editors opened from now on pick the colours up when created
+        root = self.app.root
+        root.option_add("*editor.background", theme["EDITOR_BG"])
+        root.option_add("*editor.foreground", theme["FG"])
+        root.option_add("*editor.insertBackground", theme["CURSOR"])
+        root.option_add("*editor.selectBackground", theme["TREE_SELECT"])
+        
+        # Options are only read at creation, so open editors are updated here
         for filename, (tab_id, text_widget) in self.open_files.items():
             text_widget.configure(
                 bg=theme["EDITOR_BG"],
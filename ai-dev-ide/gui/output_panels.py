@@ -3,12 +3,33 @@ Output Panels Module
 """
 import tkinter as tk
 from tkinter import ttk
-import datetime
+import time
+import threading
+from collections import deque
+
+# Lines kept in each output widget; older lines are trimmed
+MAX_OUTPUT_LINES = 5000
+
+# Milliseconds log messages are queued before being written in one insert
+LOG_FLUSH_MS = 50
+
+# Script output lines remembered for error analysis
+SCRIPT_TAIL_LINES = 500
 
 class OutputPanels:
     def __init__(self, parent_panedwindow, app):
         self.app = app
+        # Last script output lines, ending with the current (partial) line
+        self.script_tail = deque(maxlen=SCRIPT_TAIL_LINES + 1)
+        self._flush_scheduled = False
+        # Log timestamps are reformatted only when the second changes
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        self._queue_lock = threading.Lock()
         self.setup_panels(parent_panedwindow)
+        self._ai_queue = deque()
+        self._script_queue = deque()
+        self._queues = ((self.ai_output, self._ai_queue), (self.script_output, self._script_queue))
 
     def setup_panels(self, parent):
         # AI Output panel
@@ -44,23 +65,65 @@ class OutputPanels:
 
     def log_ai(self, message):
         """Log to AI output"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted = f"[{timestamp}] {message}\n"
-        self.ai_output.insert("end", formatted)
-        self.ai_output.see("end")
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        formatted = f"[{self._last_ts_str}] {message}\n"
+        self._enqueue(self._ai_queue, formatted)
 
     def log_script(self, message):
         """Log to script output"""
-        self.script_output.insert("end", message)
-        self.script_output.see("end")
+        lines = message.split("\n")
+        if self.script_tail:
+            lines[0] = self.script_tail.pop() + lines[0]
+        self.script_tail.extend(lines)
+        self._enqueue(self._script_queue, message)
+
+    def get_script_tail(self):
+        """Recent script output without reading back the whole widget"""
+        return "\n".join(self.script_tail)
+
+    def _enqueue(self, queue, text):
+        """Queue text for a panel, scheduling a flush if none is pending"""
+        with self._queue_lock:
+            queue.append(text)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self.app.root.after(LOG_FLUSH_MS, self._flush)
+
+    def _flush(self):
+        """Write each panel's queued text with a single insert"""
+        with self._queue_lock:
+            batches = [(widget, "".join(queue)) for widget, queue in self._queues]
+            for _, queue in self._queues:
+                queue.clear()
+            self._flush_scheduled = False
+        for widget, text in batches:
+            if text:
+                self._append(widget, text)
+
+    def _append(self, widget, text):
+        """Insert a flushed batch at the end, then trim the oldest lines"""
+        widget.insert("end", text)
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > MAX_OUTPUT_LINES:
+            widget.delete("1.0", f"{line_count - MAX_OUTPUT_LINES + 1}.0")
+        widget.see("end")
 
     def clear_ai_output(self):
         """Clear AI output"""
+        with self._queue_lock:
+            self._ai_queue.clear()
         self.ai_output.delete("1.0", "end")
 
     def clear_script_output(self):
         """Clear script output"""
+        with self._queue_lock:
+            self._script_queue.clear()
         self.script_output.delete("1.0", "end")
+        self.script_tail.clear()
 
     def apply_theme(self, theme):
         """Apply theme to output panels"""
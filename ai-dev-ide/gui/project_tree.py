@@ -2,15 +2,22 @@
 Project Tree Module
 """
 import os
+import bisect
 import tkinter as tk
 from tkinter import ttk
 import threading
 
+# Tree rows handed to the UI thread per event loop callback
+INSERT_BATCH = 200
+
 class ProjectTree(ttk.Frame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
         self.project_path = None
+        self.root_id = None
+        self.path_items = {}  # normalized relative path -> tree item
+        self.placeholders = set()  # dummy children of folders not yet read
         self.setup_tree()
 
     def setup_tree(self):
@@ -19,7 +26,9 @@ class ProjectTree(ttk.Frame):
         self.tree_frame.pack(fill="both", expand=True)
 
         # Create Treeview
-        self.tree = ttk.Treeview(self.tree_frame, show="tree", selectmode="browse")
+        # Each item keeps its absolute path in a hidden column
+        self.tree = ttk.Treeview(self.tree_frame, show="tree", selectmode="browse",
+                                 columns=("path",), displaycolumns=())
         self.tree.pack(side="left", fill="both", expand=True)
 
         # Scrollbar
@@ -30,6 +39,7 @@ class ProjectTree(ttk.Frame):
         # Bind events
         self.tree.bind("<Double-1>", self.on_double_click)
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<<TreeviewOpen>>", self.on_open)
 
         # Context menu
         self.setup_context_menu()
@@ -52,37 +62,132 @@ class ProjectTree(ttk.Frame):
         """Load project into tree"""
         self.project_path = project_path
         self.tree.delete(*self.tree.get_children())
+        self.root_id = None
+        self.path_items = {}
+        self.placeholders = set()
         
         if not project_path or not os.path.exists(project_path):
             return
         
         # Add project root
         root_name = os.path.basename(project_path)
-        root_id = self.tree.insert("", "end", text=root_name, open=True)
+        root_id = self.tree.insert("", "end", text=root_name, values=(project_path,), open=True)
+        self.root_id = root_id
         
-        # Populate in background thread
-        threading.Thread(target=self.populate_tree, args=(project_path, root_id), daemon=True).start()
+        # Read the folder in the background; widgets are only touched on the UI thread
+        threading.Thread(target=self._load_worker, args=(project_path, root_id), daemon=True).start()
 
-    def populate_tree(self, path, parent=""):
-        """Populate tree with files and directories"""
+    def _load_worker(self, project_path, root_id):
+        records = self.scan_directory(project_path, project_path)
+        for start in range(0, len(records), INSERT_BATCH):
+            self.tree.after(0, self._apply_inserts, root_id, records[start:start + INSERT_BATCH])
+
+    @staticmethod
+    def scan_directory(path, project_path):
+        """
+        List one folder as sorted (name, path, rel_path, is_dir) records
+        
+        Touches no widgets, so it is safe to call from any thread.
+        Hidden entries and __pycache__ are skipped.
+        """
+        # scandir entries carry their type, so no extra stat per entry
+        prefix_len = len(os.path.join(project_path, ""))
         try:
-            items = os.listdir(path)
-            for item in sorted(items):
-                full_path = os.path.join(path, item)
-                rel_path = os.path.relpath(full_path, self.project_path)
-                
-                # Skip hidden files and __pycache__
-                if item.startswith('.') or item == '__pycache__':
-                    continue
-                
-                if os.path.isdir(full_path):
-                    node_id = self.tree.insert(parent, "end", text=item, open=False)
-                    # Populate subdirectories
-                    self.populate_tree(full_path, node_id)
-                else:
-                    self.tree.insert(parent, "end", text=item, tags=("file",))
-        except:
-            pass
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return []
+        return [
+            (entry.name, entry.path, entry.path[prefix_len:], entry.is_dir(follow_symlinks=False))
+            for entry in entries
+            if not entry.name.startswith('.') and entry.name != '__pycache__'
+        ]
+
+    def _apply_inserts(self, parent, records):
+        """Insert scanned records under parent in one tight loop"""
+        # The project may have been reloaded since the scan
+        if not self.tree.exists(parent):
+            return
+        for record in records:
+            # A refresh may already have added it
+            if record[2] not in self.path_items:
+                self._insert_record(parent, "end", record)
+
+    def _insert_record(self, parent, index, record):
+        name, path, rel_path, is_dir = record
+        if is_dir:
+            node_id = self.tree.insert(parent, index, text=name, values=(path,), open=False)
+            self.path_items[rel_path] = node_id
+            # Placeholder so the folder shows as expandable
+            self.placeholders.add(self.tree.insert(node_id, "end", text="..."))
+        else:
+            self.path_items[rel_path] = self.tree.insert(parent, index, text=name, values=(path,), tags=("file",))
+
+    def populate_tree(self, path, parent=""):
+        """
+        Populate one level of the tree with files and directories
+        
+        Subdirectories get a placeholder child and are only read when
+        first expanded. Must be called on the UI thread.
+        """
+        self._apply_inserts(parent, self.scan_directory(path, self.project_path))
+
+    def is_unloaded(self, item):
+        """Whether a folder node still only holds its placeholder"""
+        children = self.tree.get_children(item)
+        return len(children) == 1 and children[0] in self.placeholders
+
+    def on_open(self, event):
+        """Read a folder's contents the first time it is expanded"""
+        item = self.tree.focus()
+        if item and self.is_unloaded(item):
+            placeholder = self.tree.get_children(item)[0]
+            self.placeholders.discard(placeholder)
+            self.tree.delete(placeholder)
+            self.populate_tree(self.get_full_path(item), item)
+
+    def refresh_paths(self, paths):
+        """
+        Update only the given files instead of rescanning the project
+        
+        Existing nodes are tagged as modified; missing files and their
+        parent folders are inserted in sorted position.
+        
+        Args:
+            paths: File paths, absolute or relative to the project
+        """
+        if not self.project_path or self.root_id is None:
+            return
+        
+        for path in paths:
+            rel_path = os.path.normpath(os.path.relpath(os.path.join(self.project_path, path), self.project_path))
+            parts = rel_path.split(os.sep)
+            if parts[0] == os.pardir or any(part.startswith('.') or part == '__pycache__' for part in parts):
+                continue
+            
+            item = self.path_items.get(rel_path)
+            if item is not None:
+                self.tree.item(item, tags=("file", "modified"))
+                continue
+            
+            # Create any missing folders on the way down
+            parent = self.root_id
+            for depth, part in enumerate(parts):
+                key = os.path.join(*parts[:depth + 1])
+                item = self.path_items.get(key)
+                if item is None:
+                    siblings = [self.tree.item(child, "text") for child in self.tree.get_children(parent)]
+                    index = bisect.bisect(siblings, part)
+                    values = (os.path.join(self.project_path, key),)
+                    if depth < len(parts) - 1:
+                        item = self.tree.insert(parent, index, text=part, values=values, open=False)
+                    else:
+                        item = self.tree.insert(parent, index, text=part, values=values, tags=("file", "modified"))
+                    self.path_items[key] = item
+                elif depth < len(parts) - 1 and self.is_unloaded(item):
+                    # The file will show up when this folder is first opened
+                    break
+                parent = item
 
     def on_double_click(self, event):
         """Handle double click on file"""
@@ -103,8 +208,13 @@ class ProjectTree(ttk.Frame):
 
     def get_full_path(self, item):
         """Get full path for tree item"""
+        values = self.tree.item(item, "values")
+        if values:
+            return values[0]
+        
         path_parts = []
-        while item:
+        # The root node shows the project folder itself, already in project_path
+        while item and item != self.root_id:
             text = self.tree.item(item, "text")
             path_parts.append(text)
             item = self.tree.parent(item)
@@ -140,9 +250,60 @@ class ProjectTree(ttk.Frame):
                     messagebox.showerror("Error", f"Failed to delete: {e}")
 
     def refresh(self):
-        """Refresh tree view"""
-        if self.project_path:
+        """Refresh tree view, keeping expanded folders and scroll position"""
+        if not self.project_path:
+            return
+        if self.root_id is None or not self.tree.exists(self.root_id) or not os.path.isdir(self.project_path):
             self.load_project(self.project_path)
+            return
+        self._sync(self.root_id, self.project_path)
+
+    def _children_of(self, node):
+        """Map each real child of node to its item, skipping placeholders"""
+        return {
+            self.tree.item(child, "text"): child
+            for child in self.tree.get_children(node)
+            if child not in self.placeholders
+        }
+
+    def _sync(self, node, path):
+        """
+        Bring one folder's nodes in line with the disk
+        
+        Missing entries are inserted in sorted position and vanished ones
+        removed. Folders that have been read are compared recursively;
+        unread ones are left to on_open.
+        """
+        records = self.scan_directory(path, self.project_path)
+        children = self._children_of(node)
+        names = {record[0] for record in records}
+        for name, item in children.items():
+            if name not in names:
+                self._remove_item(item)
+        
+        # Surviving children are already in sorted order, so each record's
+        # index is its position once every earlier record is present
+        for index, record in enumerate(records):
+            item = children.get(record[0])
+            if item is not None and self.is_folder(item) != record[3]:
+                self._remove_item(item)
+                item = None
+            if item is None:
+                self._insert_record(node, index, record)
+            elif record[3] and not self.is_unloaded(item):
+                self._sync(item, record[1])
+
+    def is_folder(self, item):
+        """Whether a node stands for a folder rather than a file"""
+        return "file" not in self.tree.item(item, "tags")
+
+    def _remove_item(self, item):
+        """Delete a node and forget it and everything under it"""
+        rel_path = os.path.relpath(self.get_full_path(item), self.project_path)
+        prefix = os.path.join(rel_path, "")
+        for key in [key for key in self.path_items if key == rel_path or key.startswith(prefix)]:
+            del self.path_items[key]
+        self.tree.delete(item)
 
     def apply_theme(self, theme):
         """Apply theme to tree"""
@@ -152,4 +313,5 @@ class ProjectTree(ttk.Frame):
                        foreground=theme["TREE_FG"],
                        fieldbackground=theme["TREE_BG"])
         style.map('Treeview', 
-                 background=[('selected', theme["TREE_SELECT"])])
\ No newline at end of file
+                 background=[('selected', theme["TREE_SELECT"])])
+        self.tree.tag_configure("modified", foreground=theme["BTN_ACTIVE"])
\ No newline at end of file
@@ -4,48 +4,104 @@ Settings Window Module
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 import json
+import functools
+from types import MappingProxyType
+
+# Colours each theme preset fills into the pickers; read-only, shared by
+# every settings window
+_THEME_PRESETS = MappingProxyType({
+    "Dark": MappingProxyType({
+        "BG": "#1e1f23", "FG": "#d6d6d6", "EDITOR_BG": "#0f1113",
+        "BTN": "#555555", "BTN_ACTIVE": "#ff6600", "CURSOR": "#ffffff"
+    }),
+    "Light": MappingProxyType({
+        "BG": "#f3f3f3", "FG": "#1e1e1e", "EDITOR_BG": "#ffffff",
+        "BTN": "#e0e0e0", "BTN_ACTIVE": "#0078d4", "CURSOR": "#000000"
+    }),
+    "Blue": MappingProxyType({
+        "BG": "#1a1d29", "FG": "#e1e1e6", "EDITOR_BG": "#0d1017",
+        "BTN": "#3a3f5b", "BTN_ACTIVE": "#5a86ff", "CURSOR": "#ffffff"
+    })
+})
+
+# (attribute, settings key, default) for each setting variable, used to
+# refresh a reopened window; tabs not built yet have no attribute
+_SETTING_VARS = (
+    ("provider_var", "api_provider", "ollama"),
+    ("api_url_var", "api_url", "http://localhost:11434/api/generate"),
+    ("model_var", "model", "tinyllama:1.1b"),
+    ("hf_token_var", "huggingface_token", ""),
+    ("max_files_var", "max_files", 5),
+    ("summarize_files_var", "summarize_files", True),
+    ("github_token_var", "github_token", ""),
+    ("repo_name_var", "default_repo_name", ""),
+    ("private_repo_var", "private_repo", False),
+    ("timeout_var", "timeout", 120),
+    ("max_response_var", "max_response", 4000),
+    ("autosave_var", "autosave", True),
+    ("clear_logs_var", "clear_logs", False),
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_test_llm():
+    """Import the connection tester on first use, then reuse it"""
+    from core.llm import test_llm_connection
+    return test_llm_connection
 
 class SettingsWindow:
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
         self.window = None
-        self.settings = app.settings.copy()
+        self.settings = None
         
     def show(self):
         """Show the settings window"""
+        # Edits go to a copy until saved; theme is the one nested dict
+        self.settings = dict(self.app.settings)
+        if "theme" in self.settings:
+            self.settings["theme"] = dict(self.settings["theme"])
+        
+        # A closed window is only hidden; show it again with fresh values
         if self.window and self.window.winfo_exists():
+            if self.window.state() == "withdrawn":
+                self._reload_vars()
+                self.window.deiconify()
             self.window.lift()
             return
-            
+        
         self.window = tk.Toplevel(self.parent)
         self.window.title("Settings")
         self.window.geometry("700x750")
         self.window.configure(bg=self.app.theme["BG"])
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Create notebook for tabs
-        notebook = ttk.Notebook(self.window)
-        notebook.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.create_ai_tab(notebook)
-        self.create_github_tab(notebook)
-        self.create_theme_tab(notebook)
-        self.create_advanced_tab(notebook)
+        # Create notebook for tabs; each tab's widgets are built the first
+        # time it is selected
+        self.notebook = ttk.Notebook(self.window)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        self._tab_builders = {}
+        self._tab_built = set()
+        for title, builder in (("AI", self.create_ai_tab), ("GitHub", self.create_github_tab),
+                               ("Theme", self.create_theme_tab), ("Advanced", self.create_advanced_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (title, builder)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._build_tab(self.notebook.select())
         
         # Buttons
         button_frame = ttk.Frame(self.window)
         button_frame.pack(fill="x", padx=10, pady=10)
         
         ttk.Button(button_frame, text="Save", command=self.save_settings).pack(side="right", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side="right", padx=5)
-        ttk.Button(button_frame, text="Test Connection", command=self.test_connection).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.hide).pack(side="right", padx=5)
+        self.test_button = ttk.Button(button_frame, text="Test Connection", command=self.test_connection)
+        self.test_button.pack(side="left", padx=5)
     
-    def create_ai_tab(self, notebook):
+    def create_ai_tab(self, frame):
         """Create AI settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="AI")
         
         # API Provider
         ttk.Label(frame, text="API Provider:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
@@ -69,8 +125,12 @@ class SettingsWindow:
         hf_entry = ttk.Entry(frame, textvariable=self.hf_token_var, width=40, show="*")
         hf_entry.grid(row=3, column=1, padx=10, pady=5, sticky="w")
         
+        # Visibility is tracked here rather than read back from the entry
+        hf_hidden = [True]
+        
         def toggle_hf_token():
-            hf_entry.config(show="" if hf_entry.cget('show') == '*' else '*')
+            hf_hidden[0] = not hf_hidden[0]
+            hf_entry.config(show='*' if hf_hidden[0] else '')
         
         ttk.Button(frame, text="Show/Hide", command=toggle_hf_token).grid(row=3, column=2, padx=5)
         
@@ -83,18 +143,19 @@ class SettingsWindow:
         self.summarize_files_var = tk.BooleanVar(value=self.settings.get("summarize_files", True))
         ttk.Checkbutton(frame, text="Summarize large files", variable=self.summarize_files_var).grid(row=6, column=0, columnspan=2, sticky="w", padx=20, pady=2)
     
-    def create_github_tab(self, notebook):
+    def create_github_tab(self, frame):
         """Create GitHub settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="GitHub")
         
         ttk.Label(frame, text="GitHub Token:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
         self.github_token_var = tk.StringVar(value=self.settings.get("github_token", ""))
         github_entry = ttk.Entry(frame, textvariable=self.github_token_var, width=40, show="*")
         github_entry.grid(row=0, column=1, padx=10, pady=5, sticky="w")
         
+        github_hidden = [True]
+        
         def toggle_github_token():
-            github_entry.config(show="" if github_entry.cget('show') == '*' else '*')
+            github_hidden[0] = not github_hidden[0]
+            github_entry.config(show='*' if github_hidden[0] else '')
         
         ttk.Button(frame, text="Show/Hide", command=toggle_github_token).grid(row=0, column=2, padx=5)
         
@@ -105,10 +166,8 @@ class SettingsWindow:
         self.private_repo_var = tk.BooleanVar(value=self.settings.get("private_repo", False))
         ttk.Checkbutton(frame, text="Create private repositories by default", variable=self.private_repo_var).grid(row=2, column=0, columnspan=2, sticky="w", padx=10, pady=5)
     
-    def create_theme_tab(self, notebook):
+    def create_theme_tab(self, frame):
         """Create theme settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Theme")
         
         # Theme presets
         ttk.Label(frame, text="Theme Preset:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
@@ -132,18 +191,21 @@ class SettingsWindow:
         for i, (label, key) in enumerate(colors):
             ttk.Label(frame, text=f"{label}:").grid(row=i+2, column=0, sticky="w", padx=10, pady=5)
             
-            color_var = tk.StringVar(value=self.app.theme.get(key, "#000000"))
+            color_var, color_frame = self._make_swatch(frame, self.app.theme.get(key, "#000000"))
             self.color_vars[key] = color_var
-            
-            color_frame = tk.Frame(frame, bg=color_var.get(), width=30, height=20, relief="solid")
             color_frame.grid(row=i+2, column=1, padx=10, pady=5, sticky="w")
             
-            ttk.Button(frame, text="Pick", command=lambda k=key, f=color_frame: self.pick_color(k, f)).grid(row=i+2, column=2, padx=5)
+            ttk.Button(frame, text="Pick", command=functools.partial(self.pick_color, key, color_frame)).grid(row=i+2, column=2, padx=5)
+    
+    def _make_swatch(self, parent, initial):
+        """A colour variable and a swatch that repaints whenever it is set"""
+        var = tk.StringVar(value=initial)
+        swatch = tk.Frame(parent, bg=initial, width=30, height=20, relief="solid")
+        var.trace_add("write", lambda *_: swatch.config(bg=var.get()))
+        return var, swatch
     
-    def create_advanced_tab(self, notebook):
+    def create_advanced_tab(self, frame):
         """Create advanced settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Advanced")
         
         # Timeout settings
         ttk.Label(frame, text="AI Timeout (seconds):").grid(row=0, column=0, sticky="w", padx=10, pady=5)
@@ -163,40 +225,47 @@ class SettingsWindow:
         self.clear_logs_var = tk.BooleanVar(value=self.settings.get("clear_logs", False))
         ttk.Checkbutton(frame, text="Clear logs before running", variable=self.clear_logs_var).grid(row=3, column=0, columnspan=2, sticky="w", padx=10, pady=5)
     
+    def _reload_vars(self):
+        """Reset the built tabs' variables to the current settings"""
+        for attr, key, default in _SETTING_VARS:
+            var = getattr(self, attr, None)
+            if var is not None:
+                var.set(self.settings.get(key, default))
+        for key, var in getattr(self, "color_vars", {}).items():
+            var.set(self.app.theme.get(key, "#000000"))
+    
+    def hide(self):
+        """Hide the window, keeping its widgets for the next show()"""
+        self.window.withdraw()
+    
+    def _on_tab_changed(self, event):
+        self._build_tab(self.notebook.select())
+    
+    def _build_tab(self, tab_id):
+        """Create a tab's widgets unless it already has them"""
+        title, builder = self._tab_builders[str(tab_id)]
+        if title not in self._tab_built:
+            self._tab_built.add(title)
+            builder(self.notebook.nametowidget(tab_id))
+    
     def pick_color(self, key, frame):
         """Pick a color for theme element"""
         color = colorchooser.askcolor(title=f"Choose {key} color", initialcolor=frame.cget("bg"))[1]
         if color:
-            frame.config(bg=color)
             self.color_vars[key].set(color)
     
     def apply_theme_preset(self):
         """Apply theme preset"""
         preset = self.theme_preset_var.get()
-        presets = {
-            "Dark": {
-                "BG": "#1e1f23", "FG": "#d6d6d6", "EDITOR_BG": "#0f1113",
-                "BTN": "#555555", "BTN_ACTIVE": "#ff6600", "CURSOR": "#ffffff"
-            },
-            "Light": {
-                "BG": "#f3f3f3", "FG": "#1e1e1e", "EDITOR_BG": "#ffffff",
-                "BTN": "#e0e0e0", "BTN_ACTIVE": "#0078d4", "CURSOR": "#000000"
-            },
-            "Blue": {
-                "BG": "#1a1d29", "FG": "#e1e1e6", "EDITOR_BG": "#0d1017",
-                "BTN": "#3a3f5b", "BTN_ACTIVE": "#5a86ff", "CURSOR": "#ffffff"
-            }
-        }
-        
-        if preset in presets:
-            for key, value in presets[preset].items():
+        if preset in _THEME_PRESETS:
+            for key, value in _THEME_PRESETS[preset].items():
                 if key in self.color_vars:
                     self.color_vars[key].set(value)
             messagebox.showinfo("Theme Applied", f"{preset} theme applied to preview")
     
     def test_connection(self):
         """Test AI connection"""
-        from core.llm import test_llm_connection
+        test_llm_connection = _get_test_llm()
         
         api_provider = self.provider_var.get()
         api_url = self.api_url_var.get()
@@ -207,56 +276,81 @@ class SettingsWindow:
             messagebox.showerror("Error", "Please fill in API URL and Model")
             return
         
-        try:
-            success, message = test_llm_connection(api_provider, api_url, model, token)
-            if success:
-                messagebox.showinfo("Success", f"Connection successful!\n\nResponse: {message[:200]}...")
-            else:
-                messagebox.showerror("Error", f"Connection failed:\n\n{message}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Test failed: {str(e)}")
+        # The request can take up to the full timeout, so it runs on the
+        # app's worker pool; the button stays disabled until it returns
+        self.test_button.state(["disabled"])
+        window = self.window
+        
+        def worker():
+            try:
+                result = test_llm_connection(api_provider, api_url, model, token)
+            except Exception as e:
+                result = e
+            window.after(0, self.show_test_result, window, result)
+        
+        self.app.run_in_background(worker)
+    
+    def show_test_result(self, window, result):
+        """Report a finished connection test, if its window is still open"""
+        if not window.winfo_exists():
+            return
+        self.test_button.state(["!disabled"])
+        if window.state() == "withdrawn":
+            return
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Test failed: {str(result)}", parent=window)
+            return
+        success, message = result
+        if success:
+            messagebox.showinfo("Success", f"Connection successful!\n\nResponse: {message[:200]}...", parent=window)
+        else:
+            messagebox.showerror("Error", f"Connection failed:\n\n{message}", parent=window)
     
     def save_settings(self):
         """Save all settings"""
-        # AI Settings
-        self.settings.update({
-            "api_provider": self.provider_var.get(),
-            "api_url": self.api_url_var.get(),
-            "model": self.model_var.get(),
-            "huggingface_token": self.hf_token_var.get(),
-            "max_files": self.max_files_var.get(),
-            "summarize_files": self.summarize_files_var.get()
-        })
-        
-        # GitHub Settings
-        self.settings.update({
-            "github_token": self.github_token_var.get(),
-            "default_repo_name": self.repo_name_var.get(),
-            "private_repo": self.private_repo_var.get()
-        })
-        
-        # Theme Settings
-        theme = {}
-        for key, var in self.color_vars.items():
-            theme[key] = var.get()
-        self.settings["theme"] = theme
-        
-        # Advanced Settings
-        self.settings.update({
-            "timeout": self.timeout_var.get(),
-            "max_response": self.max_response_var.get(),
-            "autosave": self.autosave_var.get(),
-            "clear_logs": self.clear_logs_var.get()
-        })
-        
-        # Update app
-        self.app.save_settings(self.settings)
+        # Tabs never opened keep the values already in self.settings
+        built = self._tab_built
+        new = {}
+        if "AI" in built:
+            new.update(
+                api_provider=self.provider_var.get(),
+                api_url=self.api_url_var.get(),
+                model=self.model_var.get(),
+                huggingface_token=self.hf_token_var.get(),
+                max_files=self.max_files_var.get(),
+                summarize_files=self.summarize_files_var.get()
+            )
+        if "GitHub" in built:
+            new.update(
+                github_token=self.github_token_var.get(),
+                default_repo_name=self.repo_name_var.get(),
+                private_repo=self.private_repo_var.get()
+            )
+        if "Theme" in built:
+            # The swatches hold legacy keys, so compare them with the theme
+            # in use; the saved theme has the normalized role names
+            colors = {key: var.get() for key, var in self.color_vars.items()}
+            if any(value != self.app.theme.get(key, "#000000") for key, value in colors.items()):
+                new["theme"] = dict(self.settings.get("theme", {}), **colors)
+        if "Advanced" in built:
+            new.update(
+                timeout=self.timeout_var.get(),
+                max_response=self.max_response_var.get(),
+                autosave=self.autosave_var.get(),
+                clear_logs=self.clear_logs_var.get()
+            )
+        
+        # Update app, and only write to disk when something changed
+        changed = {key: value for key, value in new.items() if self.settings.get(key) != value}
+        if changed:
+            self.settings.update(changed)
+            self.app.save_settings(self.settings)
         messagebox.showinfo("Settings Saved", "Settings have been saved successfully.")
-        self.window.destroy()
+        self.hide()
     
     def on_close(self):
         """Handle window close"""
         if messagebox.askyesno("Save Settings", "Do you want to save changes before closing?"):
             self.save_settings()
         else:
-            self.window.destroy()
\ No newline at end of file
+            self.hide()
\ No newline at end of file
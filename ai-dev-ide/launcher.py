@@ -3,24 +3,59 @@ Fast launcher for AI Dev IDE
 """
 import os
 import sys
+import hashlib
+import importlib
 import subprocess
 
+# Packages probed before launch; tkinter is left to `import app`, which
+# needs it anyway
+REQUIRED_PACKAGES = ["requests"]
+
+# Records the interpreter that last passed the dependency check
+DEPS_MARKER_PATH = os.path.join(os.path.expanduser("~"), ".ai_dev_ide_deps_ok")
+
 def check_dependencies():
     """Check if required packages are installed"""
-    required = ["requests", "tkinter"]
     missing = []
     
-    for package in required:
+    for package in REQUIRED_PACKAGES:
         try:
-            if package == "tkinter":
-                import tkinter
-            else:
-                __import__(package)
+            __import__(package)
         except ImportError:
             missing.append(package)
     
     return missing
 
+def deps_key():
+    """Identify this interpreter, so a new Python gets checked again"""
+    return hashlib.sha1((sys.executable + sys.version).encode()).hexdigest()
+
+def deps_already_checked(key):
+    """Whether this interpreter has passed the dependency check before"""
+    try:
+        with open(DEPS_MARKER_PATH, 'r', encoding='utf-8') as f:
+            return f.read().strip() == key
+    except OSError:
+        return False
+
+def forget_deps_check():
+    """Drop the marker so the next launch checks dependencies again"""
+    try:
+        os.remove(DEPS_MARKER_PATH)
+    except OSError:
+        pass
+
+def install_requirements(missing):
+    """Install requirements.txt after reporting the missing packages"""
+    print(f"Missing packages: {', '.join(missing)}")
+    print("Installing requirements...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    except:
+        print("Could not install from requirements.txt")
+        print("Please install manually: pip install requests")
+    importlib.invalidate_caches()
+
 def main():
     print("🚀 AI Dev IDE - Modular Launcher")
     print("=" * 40)
@@ -31,16 +66,18 @@ def main():
         print("   Current dir:", os.getcwd())
         print("   Looking for: app.py, gui/, agents/, core/")
     
-    # Check dependencies
-    missing = check_dependencies()
-    if missing:
-        print(f"Missing packages: {', '.join(missing)}")
-        print("Installing requirements...")
+    # Check dependencies, unless this interpreter already passed
+    key = deps_key()
+    checked = deps_already_checked(key)
+    missing = [] if checked else check_dependencies()
+    if not missing and not checked:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        except:
-            print("Could not install from requirements.txt")
-            print("Please install manually: pip install requests")
+            with open(DEPS_MARKER_PATH, 'w', encoding='utf-8') as f:
+                f.write(key)
+        except OSError:
+            pass
+    elif missing:
+        install_requirements(missing)
     
     # Check if setup guide should run
     settings_path = os.path.join(os.path.expanduser("~"), ".ai_dev_ide_settings.json")
@@ -56,7 +93,16 @@ def main():
     # Launch the app
     print("\n🎯 Launching AI Dev IDE...")
     try:
-        import app
+        try:
+            import app
+        except ImportError:
+            # A package may have been removed since the marker was written
+            forget_deps_check()
+            missing = check_dependencies()
+            if not missing:
+                raise
+            install_requirements(missing)
+            import app
         app.main()
     except Exception as e:
         print(f"Error launching app: {e}")